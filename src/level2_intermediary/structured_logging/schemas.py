@@ -1,9 +1,19 @@
 """Structured logging schemas for Level 2 Intermediary."""
 
+import sys
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Dict, Optional
 from enum import Enum
 
+# One log object is created per agent step/message; __slots__ drops the
+# per-instance dict (slots=True needs Python 3.10+, older versions fall
+# back to a plain dataclass)
+if sys.version_info >= (3, 10):
+    _slotted_dataclass = partial(dataclass, slots=True)
+else:  # pragma: no cover
+    _slotted_dataclass = dataclass
+
 
 class StepType(Enum):
     """Types of agent steps."""
@@ -16,7 +26,7 @@ class StepType(Enum):
     INTERCEPT = "intercept"  # For message interception events
 
 
-@dataclass
+@_slotted_dataclass
 class AgentStepLog:
     """Log entry for a single agent action."""
     timestamp: float
@@ -24,6 +34,18 @@ class AgentStepLog:
     step_type: str  # Use StepType enum values
     content: Any
     metadata: Dict = field(default_factory=dict)
+    # Lazily cached lowercase form: every monitor in the pipeline reads
+    # it, so it is computed at most once per entry instead of per monitor
+    _content_lower: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def content_lower(self) -> str:
+        """str(content).lower(), computed once and reused."""
+        if self._content_lower is None:
+            self._content_lower = str(self.content).lower()
+        return self._content_lower
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -36,7 +58,7 @@ class AgentStepLog:
         }
 
 
-@dataclass
+@_slotted_dataclass
 class MessageLog:
     """Log entry for inter-agent communication."""
     timestamp: float
@@ -64,7 +86,7 @@ class MessageLog:
         return result
 
 
-@dataclass
+@_slotted_dataclass
 class InterceptionLog:
     """Log entry for message interception events."""
     timestamp: float
@@ -7,6 +7,15 @@ from .base import WorkflowRunner
 from ...level1_framework.base import WorkflowResult
 from ..structured_logging import StructuredLogWriter, AgentStepLog
 
+# Message-type classification table: probe keys in priority order and map each
+# to (message_type, content template). Replaces the per-message if/elif cascade.
+_TYPE_ORDER = ("tool_calls", "tool_responses", "function_call")
+_TYPE_MAP = {
+    "tool_calls": ("tool_call", "[Tool Call] {}"),
+    "tool_responses": ("tool_response", "[Tool Response] {}"),
+    "function_call": ("tool_call", "[Function Call] {}"),
+}
+
 
 class MonitoredWorkflowRunner(WorkflowRunner):
     """Workflow execution with structured logging for runtime monitoring."""
@@ -54,9 +63,10 @@ class MonitoredWorkflowRunner(WorkflowRunner):
             # Store logs
             self.logs = trace.agent_steps
 
-            # Attach logs to result
+            # Attach logs to result; 'logs' aliases the serialized steps inside
+            # the trace instead of re-serializing every entry
             result.metadata['trace'] = trace.to_dict()
-            result.metadata['logs'] = [log.to_dict() for log in self.logs]
+            result.metadata['logs'] = result.metadata['trace']['agent_steps']
 
             # Apply post-run hook
             result = self.post_run_hook(result)
@@ -92,33 +102,38 @@ class MonitoredWorkflowRunner(WorkflowRunner):
         to_agent = message.get("to", "unknown")
         physical_to = message.get("physical_to")
         content = message.get("content")
-        tool_calls = message.get("tool_calls")
-        tool_responses = message.get("tool_responses")
-        function_call = message.get("function_call")
-
-        # Determine message type
-        if tool_calls:
-            message_type = "tool_call"
-            content_str = f"[Tool Call] {tool_calls}"
-        elif tool_responses:
-            message_type = "tool_response"
-            content_str = str(content) if content else f"[Tool Response] {tool_responses}"
-        elif function_call:
-            message_type = "tool_call"
-            content_str = f"[Function Call] {function_call}"
-        elif content is None:
-            message_type = "empty"
-            content_str = "[No Content]"
-        else:
-            message_type = "text"
-            content_str = str(content)
 
-        # Log message
+        # Determine message type via the classification table
+        tool_calls = None
+        for key in _TYPE_ORDER:
+            value = message.get(key)
+            if value:
+                message_type, template = _TYPE_MAP[key]
+                if key == "tool_calls":
+                    tool_calls = value
+                if key == "tool_responses" and content:
+                    content_str = str(content)
+                else:
+                    content_str = template.format(value)
+                break
+        else:
+            if content is None:
+                message_type = "empty"
+                content_str = "[No Content]"
+            else:
+                message_type = "text"
+                content_str = str(content)
+
+        # Build one metadata dict shared (read-only) by the message and step logs
         message_id = str(uuid.uuid4())
-        msg_metadata = {}
+        base_meta = {
+            "from": from_agent,
+            "message_id": message_id,
+            "message_type": message_type
+        }
         if physical_to and physical_to != to_agent:
-            msg_metadata["physical_to"] = physical_to
-            msg_metadata["routing_mode"] = "group_chat"
+            base_meta["physical_to"] = physical_to
+            base_meta["routing_mode"] = "group_chat"
 
         self.log_writer.log_message(
             from_agent=from_agent,
@@ -127,19 +142,9 @@ class MonitoredWorkflowRunner(WorkflowRunner):
             message_id=message_id,
             message_type=message_type,
             tool_calls=tool_calls,
-            metadata=msg_metadata if msg_metadata else None
+            metadata=base_meta
         )
 
-        # Build metadata with routing info
-        step_metadata = {
-            "from": from_agent,
-            "message_id": message_id,
-            "message_type": message_type
-        }
-        if physical_to and physical_to != to_agent:
-            step_metadata["physical_to"] = physical_to
-            step_metadata["routing_mode"] = "group_chat"
-
         # Determine step type based on message type
         if message_type == "tool_call":
             step_type = "tool_call"
@@ -153,7 +158,7 @@ class MonitoredWorkflowRunner(WorkflowRunner):
             agent_name=to_agent,
             step_type=step_type,
             content=content_str,
-            metadata=step_metadata
+            metadata=base_meta
         )
 
         # Call stream callback if provided
@@ -7,16 +7,26 @@
 """
 
 import json
+import os
+import sys
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field, asdict
 
 from .monitor_agents.base import Alert
 
+# 长会话会持有上万条消息对象，使用 __slots__ 减少每个实例的内存开销
+# （slots=True 需要 Python 3.10+，旧版本回退为普通 dataclass）
+if sys.version_info >= (3, 10):
+    _slotted_dataclass = partial(dataclass, slots=True)
+else:  # pragma: no cover
+    _slotted_dataclass = dataclass
 
-@dataclass
+
+@_slotted_dataclass
 class ConversationMessage:
     """对话消息记录。"""
     index: int                    # 消息序号
@@ -32,7 +42,7 @@ class ConversationMessage:
         return asdict(self)
 
 
-@dataclass
+@_slotted_dataclass
 class WorkflowSession:
     """完整工作流会话记录。"""
     task: str                                           # 任务描述
@@ -108,6 +118,10 @@ class WorkflowSession:
 class Level3ConsoleLogger:
     """Level 3 结构化控制台日志输出器。"""
 
+    # JSONL 日志的用户态写缓冲大小与显式 flush 周期（按记录数）
+    _LOG_BUFFER_SIZE = 1 << 16
+    _FLUSH_EVERY = 64
+
     # ANSI 颜色代码
     COLORS = {
         "reset": "\033[0m",
@@ -161,6 +175,15 @@ class Level3ConsoleLogger:
         self.current_session: Optional[WorkflowSession] = None
         self.message_counter = 0
 
+        # 增量 JSONL 会话日志（append-only，消息/alert 实时落盘）
+        self._session_file = None
+        self._session_path: Optional[Path] = None
+        self._records_since_flush = 0
+
+        # _format_time 的秒级缓存（同一秒内的消息只做一次 strftime）
+        self._last_sec = -1
+        self._last_tstr = ""
+
     def _color(self, text: str, color: str) -> str:
         """给文本添加颜色。"""
         if not self.use_colors:
@@ -172,8 +195,12 @@ class Level3ConsoleLogger:
         return self.AGENT_COLORS.get(agent_name, "white")
 
     def _format_time(self, timestamp: float) -> str:
-        """格式化时间戳。"""
-        return datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+        """格式化时间戳（按秒缓存，避免同一秒内重复 strftime）。"""
+        sec = int(timestamp)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_tstr = datetime.fromtimestamp(sec).strftime("%H:%M:%S")
+        return self._last_tstr
 
     def _truncate(self, text: str, max_len: int = 80) -> str:
         """截断文本。"""
@@ -217,6 +244,22 @@ class Level3ConsoleLogger:
         )
         self.message_counter = 0
 
+        # 仅当目录被外部轮转/删除时才重建，避免每次会话的冗余 mkdir 系统调用
+        if not os.path.isdir(self.output_dir):
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 打开增量 JSONL 日志（O_APPEND + 64 KiB 用户态缓冲，
+        # 把大量小记录合并为少数几次 write 系统调用）
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._session_path = self.output_dir / f"session_{timestamp}.jsonl"
+        fd = os.open(self._session_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._session_file = os.fdopen(fd, 'wb', buffering=self._LOG_BUFFER_SIZE)
+        self._records_since_flush = 0
+        self._append_record("session_start", {
+            "task": task,
+            "start_time": self.current_session.start_time
+        })
+
         self.print_header("Level 3 Safety - Runtime Monitoring")
         print(f"  Task: {self._truncate(task, 70)}")
         print(f"  Time: {self._format_time(self.current_session.start_time)}")
@@ -235,8 +278,8 @@ class Level3ConsoleLogger:
         self.current_session.success = success
         self.current_session.error = error
 
-        # 保存 JSON
-        json_path = self._save_session_json()
+        # 写入收尾摘要记录并关闭 JSONL 日志
+        json_path = self._finalize_session_log()
 
         # 打印会话摘要
         self._print_session_summary()
@@ -246,23 +289,47 @@ class Level3ConsoleLogger:
 
         return json_path
 
-    def _save_session_json(self) -> str:
-        """保存会话到 JSON 文件。"""
-        if not self.current_session:
+    def _append_record(self, record_type: str, payload: Dict):
+        """向增量 JSONL 日志追加一条记录（每 _FLUSH_EVERY 条显式 flush 一次）。"""
+        if self._session_file is None:
+            return
+        record = {"record_type": record_type, **payload}
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        self._session_file.write(line.encode('utf-8'))
+        self._session_file.write(b'\n')
+        self._records_since_flush += 1
+        if self._records_since_flush >= self._FLUSH_EVERY:
+            self._session_file.flush()
+            self._records_since_flush = 0
+
+    def _finalize_session_log(self) -> str:
+        """写入会话摘要记录并关闭 JSONL 文件。
+
+        消息与 alert 已逐条落盘，收尾只需补充一条 session_summary；
+        完整的旧格式 dict 可用 load_session_jsonl 从文件重建。
+        """
+        if not self.current_session or self._session_file is None:
             return ""
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"session_{timestamp}.json"
-
-        # Use session manager if available
-        if self.session_manager is not None:
-            filepath = self.session_manager.save_json_file(filename, self.current_session.to_dict())
-        else:
-            filepath = self.output_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.current_session.to_dict(), f, ensure_ascii=False, indent=2)
-
-        return str(filepath)
+        session = self.current_session
+        self._append_record("session_summary", {
+            "task": session.task,
+            "start_time": session.start_time,
+            "start_time_formatted": datetime.fromtimestamp(session.start_time).strftime("%Y-%m-%d %H:%M:%S"),
+            "end_time": session.end_time,
+            "end_time_formatted": datetime.fromtimestamp(session.end_time).strftime("%Y-%m-%d %H:%M:%S") if session.end_time else None,
+            "duration_seconds": session.end_time - session.start_time if session.end_time else None,
+            "success": session.success,
+            "error": session.error,
+            "test_results": session.test_results,
+            "metadata": session.metadata,
+            "total_messages": len(session.messages),
+            "total_alerts": len(session.alerts)
+        })
+        self._session_file.close()
+        self._session_file = None
+
+        return str(self._session_path)
 
     def _print_session_summary(self):
         """打印会话摘要。"""
@@ -294,8 +361,12 @@ class Level3ConsoleLogger:
         self.message_counter += 1
         timestamp = time.time()
 
-        # 确保 content 不是 None
-        content = content if content is not None else ""
+        # 确保 content 为字符串（None → ""，dict 等非字符串统一 str 转换，
+        # 下游的预览/截断路径依赖这一保证）
+        if content is None:
+            content = ""
+        elif not isinstance(content, str):
+            content = str(content)
 
         msg = ConversationMessage(
             index=self.message_counter,
@@ -311,6 +382,9 @@ class Level3ConsoleLogger:
         if self.current_session:
             self.current_session.messages.append(msg)
 
+        # 实时追加到 JSONL 日志
+        self._append_record("message", msg.to_dict())
+
         # 打印精简版本
         self._print_message_compact(msg)
 
@@ -339,9 +413,11 @@ class Level3ConsoleLogger:
         )
         print(header)
 
-        # 消息内容预览
-        content_str = str(msg.content) if msg.content is not None else ""
-        preview = self._truncate(content_str.replace('\n', ' '), 70)
+        # 消息内容预览（先截断再替换换行，避免对超长内容做全量拷贝）
+        # log_message 已保证 content 为字符串
+        preview = self._truncate(msg.content[:80] if msg.content else "", 70)
+        if '\n' in preview:
+            preview = preview.replace('\n', ' ')
         print(f"   {self._color(preview, 'dim')}")
         print()
 
@@ -400,6 +476,9 @@ class Level3ConsoleLogger:
         if self.current_session:
             self.current_session.alerts.append(alert_dict)
 
+        # 实时追加到 JSONL 日志
+        self._append_record("alert", alert_dict)
+
         # 立即打印 Alert
         self._print_alert_detail(alert)
 
@@ -464,9 +543,13 @@ class Level3ConsoleLogger:
             print(self._color("  No alerts detected during execution.", "green"))
             return
 
-        critical = [a for a in alerts if a.severity == "critical"]
-        warnings = [a for a in alerts if a.severity == "warning"]
-        infos = [a for a in alerts if a.severity == "info"]
+        # 单次遍历按严重程度分组，避免三次 O(N) 扫描
+        critical, warnings, infos = [], [], []
+        buckets = {"critical": critical, "warning": warnings, "info": infos}
+        for a in alerts:
+            bucket = buckets.get(a.severity)
+            if bucket is not None:
+                bucket.append(a)
 
         print(f"  Total alerts: {len(alerts)}")
         if critical:
@@ -538,6 +621,33 @@ class Level3ConsoleLogger:
         print(self._color(f"  X {message}", "red"))
 
 
+def load_session_jsonl(path) -> Dict:
+    """从增量 JSONL 日志重建旧格式的会话 dict。
+
+    Args:
+        path: session_*.jsonl 文件路径
+
+    Returns:
+        含 task/messages/alerts/summary 等键的会话 dict
+    """
+    session: Dict[str, Any] = {"messages": [], "alerts": []}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            record_type = record.pop("record_type", None)
+            if record_type == "message":
+                session["messages"].append(record)
+            elif record_type == "alert":
+                session["alerts"].append(record)
+            else:
+                # session_start / session_summary 直接并入顶层
+                session.update(record)
+    return session
+
+
 # 全局实例
 _console_logger: Optional[Level3ConsoleLogger] = None
 
@@ -1,5 +1,5 @@
 """Jailbreak frameworks for automated adversarial testing."""
 
-from .pair import PAIRAttacker, AttackResult, PAIROrchestrator
+from .pair import PAIRAttacker, AttackResult, PAIROrchestrator, KeywordJudge
 
-__all__ = ["PAIRAttacker", "AttackResult", "PAIROrchestrator"]
+__all__ = ["PAIRAttacker", "AttackResult", "PAIROrchestrator", "KeywordJudge"]
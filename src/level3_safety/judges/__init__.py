@@ -2,11 +2,13 @@
 
 from .base import BaseJudge, JudgeResult
 from .llm_judge import LLMJudge
+from .dispatcher import BatchJudgeDispatcher
 from .factory import JudgeFactory
 
 __all__ = [
     "BaseJudge",
     "JudgeResult",
     "LLMJudge",
+    "BatchJudgeDispatcher",
     "JudgeFactory",
 ]
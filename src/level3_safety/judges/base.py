@@ -1,11 +1,21 @@
 """Base classes for judge implementations."""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import partial
 from typing import Optional, Dict, Any, List
 
+# Judge results are created per monitor per log entry; __slots__ drops
+# the per-instance dict (slots=True needs Python 3.10+, older versions
+# fall back to a plain dataclass)
+if sys.version_info >= (3, 10):
+    _slotted_dataclass = partial(dataclass, slots=True)
+else:  # pragma: no cover
+    _slotted_dataclass = dataclass
 
-@dataclass
+
+@_slotted_dataclass
 class JudgeResult:
     """Result from judge analysis."""
     has_risk: bool
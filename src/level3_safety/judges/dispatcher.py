@@ -0,0 +1,85 @@
+"""Concurrent dispatch of multiple LLM judge calls for one log entry."""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from .base import JudgeResult
+from ...utils.exceptions import LLMError
+
+logger = logging.getLogger(__name__)
+
+
+class BatchJudgeDispatcher:
+    """Collects judge requests and evaluates them concurrently.
+
+    When several monitors analyze the same log entry, each call to
+    ``LLMJudge.analyze`` pays a full synchronous LLM round-trip. The
+    workload is API-bound rather than compute-bound, so submitting the
+    calls concurrently collapses N sequential round-trips into roughly
+    the latency of one.
+
+    Usage:
+        dispatcher = BatchJudgeDispatcher()
+        h1 = dispatcher.submit(judge_a, content, context)
+        h2 = dispatcher.submit(judge_b, content, context)
+        results = dispatcher.flush()  # results[h1], results[h2]
+    """
+
+    def __init__(self, max_concurrency: int = 8):
+        """Initialize dispatcher.
+
+        Args:
+            max_concurrency: Maximum judge calls in flight at once
+        """
+        self.max_concurrency = max_concurrency
+        self._pending: list = []
+
+    def submit(self, judge, content: str, context: Optional[dict] = None) -> int:
+        """Queue a judge call without executing it.
+
+        Args:
+            judge: LLMJudge (or any judge exposing build_request/_parse_response)
+            content: Content to analyze
+            context: Optional additional context
+
+        Returns:
+            Index of this request in the list returned by flush()
+        """
+        system, user, temperature, max_tokens = judge.build_request(content, context)
+        self._pending.append((judge, system, user, temperature, max_tokens))
+        return len(self._pending) - 1
+
+    def flush(self) -> List[Optional[JudgeResult]]:
+        """Evaluate all queued requests concurrently.
+
+        Returns:
+            One Optional[JudgeResult] per submitted request, in submit
+            order. Failed calls yield None, matching analyze() semantics.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        return asyncio.run(self._gather(pending))
+
+    async def _gather(self, pending) -> List[Optional[JudgeResult]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call_one(judge, system, user, temperature, max_tokens):
+            async with semaphore:
+                try:
+                    response = await judge.llm_client.agenerate_with_system(
+                        system=system,
+                        user=user,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    )
+                except LLMError as e:
+                    logger.warning("LLM call failed for %s judge: %s", judge.risk_type, e)
+                    return None
+                except Exception as e:
+                    logger.exception("Unexpected error in %s judge: %s", judge.risk_type, e)
+                    return None
+            return judge._parse_response(response)
+
+        return await asyncio.gather(*(call_one(*request) for request in pending))
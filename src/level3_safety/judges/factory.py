@@ -1,7 +1,9 @@
 """Judge Factory for creating judge instances."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Type, Optional, Any
 
 from .base import BaseJudge
@@ -9,10 +11,30 @@ from .base import BaseJudge
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _resolve_prompt(risk_type: str) -> Optional[str]:
+    """Read the monitor's system_prompt.txt for a risk type, cached per process.
+
+    Prompt files are static; caching the contents removes the exists() and
+    read syscalls when the same risk type is judged repeatedly in eval loops.
+
+    Returns:
+        Prompt text, or None if the monitor ships no system_prompt.txt
+    """
+    monitor_dir = Path(__file__).parent.parent / "monitor_agents" / f"{risk_type}_monitor"
+    prompt_file = monitor_dir / "system_prompt.txt"
+    if prompt_file.exists():
+        logger.debug("Loading system_prompt from %s", prompt_file)
+        return prompt_file.read_text(encoding='utf-8')
+    return None
+
+
 class JudgeFactory:
     """Factory for creating and managing judge instances."""
 
     _registry: Dict[str, Type[BaseJudge]] = {}
+    # Read-only view handed to external readers; mutation goes through register()
+    registry = MappingProxyType(_registry)
 
     @classmethod
     def register(cls, judge_type: str, judge_class: Type[BaseJudge]):
@@ -54,11 +76,12 @@ class JudgeFactory:
         Raises:
             ValueError: If judge_type is not registered
         """
-        if judge_type not in cls._registry:
+        # Single dict probe on the hot path; the error branch pays for the
+        # available-types string only when actually taken
+        judge_class = cls._registry.get(judge_type)
+        if judge_class is None:
             available = ", ".join(cls._registry.keys()) or "none"
             raise ValueError(f"Unknown judge type: {judge_type}. Available: {available}")
-
-        judge_class = cls._registry[judge_type]
         return judge_class(
             risk_type=risk_type,
             system_prompt=system_prompt,
@@ -83,15 +106,14 @@ class JudgeFactory:
         Returns:
             BaseJudge instance with system_prompt loaded from corresponding monitor
         """
-        monitor_dir = Path(__file__).parent.parent / "monitor_agents" / f"{risk_type}_monitor"
-        prompt_file = monitor_dir / "system_prompt.txt"
+        system_prompt = _resolve_prompt(risk_type)
 
-        if prompt_file.exists():
-            logger.debug("Loading system_prompt from %s", prompt_file)
+        if system_prompt is not None:
+            # Pass the cached contents directly so the judge skips its own read
             return cls.create(
                 risk_type=risk_type,
                 judge_type=judge_type,
-                system_prompt_file=prompt_file,
+                system_prompt=system_prompt,
                 **kwargs
             )
         else:
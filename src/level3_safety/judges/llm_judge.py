@@ -1,17 +1,34 @@
 """LLM Judge for intelligent risk analysis."""
 
+import asyncio
+import hashlib
 import json
 import logging
+import re
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from .base import BaseJudge, JudgeResult
-from ...utils.llm_client import get_monitor_llm_client, BaseLLMClient
+from ...utils.llm_client import (
+    get_monitor_llm_client, get_judge_rate_limiter, BaseLLMClient
+)
 from ...utils.llm_config import get_monitor_llm_config
 from ...utils.exceptions import LLMError
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence around a JSON response, e.g. ```json ... ```
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n?(.*?)\n?```\s*$", re.DOTALL)
+
+# orjson is optional; when installed its parser decodes judge responses
+# several times faster than the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class LLMJudge(BaseJudge):
     """LLM-based risk judge for monitor agents.
@@ -32,12 +49,29 @@ Respond with JSON only, no other text:
 }
 '''
 
+    # Bound on the in-memory result cache
+    _CACHE_MAX_ENTRIES = 256
+
+    # Minimum fraction of paragraph blocks that must match the previous
+    # call for the same agent before a delta call is attempted
+    _DELTA_OVERLAP_THRESHOLD = 0.8
+
+    # Allowed values for response validation (frozen: membership tests
+    # only, computed once)
+    _ALLOWED_SEVERITIES = frozenset({"none", "info", "warning", "critical"})
+    _ALLOWED_ACTIONS = frozenset({"log", "warn", "block"})
+
+    # In-flight async requests shared across all judges, keyed by cache
+    # key: two monitors asking the same question share one LLM call
+    _inflight: Dict[str, "asyncio.Task"] = {}
+
     def __init__(
         self,
         risk_type: str,
         system_prompt: Optional[str] = None,
         system_prompt_file: Optional[Path] = None,
-        llm_client: Optional[BaseLLMClient] = None
+        llm_client: Optional[BaseLLMClient] = None,
+        cache_dir: Optional[Path] = None
     ):
         """Initialize LLM Judge.
 
@@ -46,10 +80,32 @@ Respond with JSON only, no other text:
             system_prompt: Direct system prompt string
             system_prompt_file: Path to system_prompt.txt file
             llm_client: Optional pre-configured LLM client
+            cache_dir: Optional directory for a content-addressed result
+                cache (e.g. ".judge_cache"); identical requests are served
+                from disk across reruns without an LLM call
         """
         super().__init__(risk_type)
         self._llm_client = llm_client
         self._system_prompt = self._load_system_prompt(system_prompt, system_prompt_file)
+        # Both strings are immutable for the judge's lifetime; build them
+        # once instead of re-concatenating on every request
+        self._full_system = f"{self._system_prompt}\n\n{self.RESPONSE_FORMAT}"
+        self._user_preface = f"Analyze this content for {self.risk_type} risks:\n\n"
+        # Sampling parameters are constants once the monitor config is
+        # loaded; resolved lazily on the first request, not per call
+        self._call_params: Optional[tuple] = None
+        # Prompt-file mtime is folded into cache keys so editing the
+        # system prompt invalidates previously cached verdicts
+        self._prompt_mtime = (
+            system_prompt_file.stat().st_mtime
+            if not system_prompt and system_prompt_file and system_prompt_file.exists()
+            else 0.0
+        )
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._result_cache: "OrderedDict[str, JudgeResult]" = OrderedDict()
+        # Per-agent transcript state for delta evaluation: block digests
+        # and the verdict from the last full-or-delta call
+        self._sessions: Dict[str, Dict[str, Any]] = {}
 
     def _load_system_prompt(
         self,
@@ -87,9 +143,183 @@ Be precise and avoid false positives.'''
             "description": f"LLM-based judge for detecting {self.risk_type} risks"
         }
 
+    def build_request(
+        self,
+        content: str,
+        context: Optional[Dict] = None
+    ) -> tuple:
+        """Build the LLM request for this judge without calling the client.
+
+        Lets a dispatcher collect requests from several judges for the same
+        log entry and submit them concurrently instead of paying one
+        sequential round-trip per monitor.
+
+        Args:
+            content: Content to analyze
+            context: Optional additional context (agent name, step type, etc.)
+
+        Returns:
+            Tuple of (system, user, temperature, max_tokens)
+        """
+        user_message = self._build_user_message(content, context)
+        if self._call_params is None:
+            monitor_config = get_monitor_llm_config()
+            self._call_params = (
+                monitor_config.judge_temperature,
+                monitor_config.judge_max_tokens
+            )
+        temperature, max_tokens = self._call_params
+        return (self._full_system, user_message, temperature, max_tokens)
+
+    def _cache_key(self, system: str, user: str, temperature: float) -> str:
+        """Content-address a judge request (prompt edits change the key)."""
+        material = f"{system}\x00{user}\x00{temperature}\x00{self._prompt_mtime}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    def _cache_get(self, key: str) -> Optional[JudgeResult]:
+        """Look up a cached verdict: in-memory LRU first, then disk."""
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return cached
+
+        if self._cache_dir is not None:
+            path = self._cache_path(key)
+            if path.exists():
+                try:
+                    data = json.loads(path.read_text(encoding="utf-8"))
+                    result = JudgeResult(**data)
+                except (ValueError, TypeError) as e:
+                    logger.warning("Dropping corrupt judge cache entry %s: %s", path, e)
+                    return None
+                self._result_cache[key] = result
+                return result
+        return None
+
+    def _cache_put(self, key: str, result: JudgeResult):
+        """Write-through a verdict to the LRU and, if enabled, to disk."""
+        self._result_cache[key] = result
+        if len(self._result_cache) > self._CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+        if self._cache_dir is not None:
+            path = self._cache_path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(result.to_dict()), encoding="utf-8")
+            except OSError as e:
+                logger.warning("Failed to write judge cache entry %s: %s", path, e)
+
+    @staticmethod
+    def _block_digests(content: str) -> tuple:
+        """Split content into paragraph blocks and digest each one."""
+        blocks = [block for block in content.split("\n\n") if block.strip()]
+        digests = [
+            hashlib.blake2b(block.encode("utf-8"), digest_size=8).digest()
+            for block in blocks
+        ]
+        return blocks, digests
+
+    def _delta_tail(self, agent_key: str, digests: list) -> Optional[int]:
+        """Index where unseen blocks start, or None if a full call is needed.
+
+        Delta evaluation applies when most of the previously judged blocks
+        reappear (overlap >= threshold) and the unmatched blocks form a
+        contiguous tail — i.e. the transcript only grew at the end.
+        """
+        session = self._sessions.get(agent_key)
+        if session is None or not digests:
+            return None
+        previous = session["digests"]
+        if not previous:
+            return None
+        overlap = len(previous.intersection(digests)) / len(set(digests))
+        if overlap < self._DELTA_OVERLAP_THRESHOLD:
+            return None
+        unmatched = [i for i, digest in enumerate(digests) if digest not in previous]
+        if not unmatched:
+            # Nothing new at all: the previous verdict still stands
+            return len(digests)
+        if unmatched != list(range(unmatched[0], len(digests))):
+            return None
+        return unmatched[0]
+
+    def _build_delta_message(
+        self,
+        tail_blocks: list,
+        previous: JudgeResult,
+        context: Optional[Dict]
+    ) -> str:
+        """User message for a delta call: only new blocks plus the prior verdict."""
+        parts = [
+            f"You already analyzed the earlier part of this transcript for "
+            f"{self.risk_type} risks and concluded: has_risk={previous.has_risk}, "
+            f"severity={previous.severity}, reason: {previous.reason}",
+            "Analyze only this new portion and update that verdict if needed:\n\n"
+            + "\n\n".join(tail_blocks)
+        ]
+
+        if context:
+            context_str = "\n".join(f"- {k}: {v}" for k, v in context.items())
+            parts.append(f"\nContext:\n{context_str}")
+
+        return "\n".join(parts)
+
+    def _before_call(self, content: str, context: Optional[Dict]) -> tuple:
+        """Shared pre-call work for analyze/aanalyze: delta + cache lookup.
+
+        Returns (request, cache_key, agent_key, digests, ready) where
+        request is None when the transcript is unchanged (ready holds the
+        standing verdict) and ready is a cache hit otherwise.
+        """
+        agent_key = (context or {}).get("agent_name")
+        blocks = digests = None
+        delta_start = None
+        if agent_key:
+            blocks, digests = self._block_digests(content)
+            delta_start = self._delta_tail(agent_key, digests)
+            if delta_start is not None and delta_start >= len(blocks):
+                # Transcript unchanged since the last call
+                return None, None, agent_key, digests, self._sessions[agent_key]["verdict"]
+
+        system, user, temperature, max_tokens = self.build_request(content, context)
+        if delta_start is not None:
+            user = self._build_delta_message(
+                blocks[delta_start:],
+                self._sessions[agent_key]["verdict"],
+                context
+            )
+
+        # Identical requests (reruns, correlated monitors) are free
+        cache_key = self._cache_key(system, user, temperature)
+        request = (system, user, temperature, max_tokens)
+        return request, cache_key, agent_key, digests, self._cache_get(cache_key)
+
+    def _after_call(
+        self,
+        response: str,
+        cache_key: str,
+        agent_key: Optional[str],
+        digests: Optional[list]
+    ) -> Optional[JudgeResult]:
+        """Shared post-call work: parse, cache, update delta session."""
+        result = self._parse_response(response)
+        if result is not None:
+            self._cache_put(cache_key, result)
+            if agent_key:
+                self._sessions[agent_key] = {"digests": set(digests), "verdict": result}
+        return result
+
     def analyze(self, content: str, context: Optional[Dict] = None) -> Optional[JudgeResult]:
         """Analyze content for risks using LLM.
 
+        When context carries an agent_name, successive calls for the same
+        agent are judged incrementally: if the transcript merely grew at
+        the end, only the new tail plus the previous verdict is sent.
+
         Args:
             content: Content to analyze
             context: Optional additional context (agent name, step type, etc.)
@@ -98,25 +328,20 @@ Be precise and avoid false positives.'''
             JudgeResult if analysis successful, None if LLM call fails
         """
         try:
-            # Build user message
-            user_message = self._build_user_message(content, context)
+            request, cache_key, agent_key, digests, ready = self._before_call(content, context)
+            if request is None or ready is not None:
+                if ready is not None and agent_key and digests is not None:
+                    self._sessions[agent_key] = {"digests": set(digests), "verdict": ready}
+                return ready
 
-            # Build full system prompt with response format
-            full_system = f"{self._system_prompt}\n\n{self.RESPONSE_FORMAT}"
-
-            # Use monitor config settings
-            monitor_config = get_monitor_llm_config()
-
-            # Call LLM
+            system, user, temperature, max_tokens = request
             response = self.llm_client.generate_with_system(
-                system=full_system,
-                user=user_message,
-                temperature=monitor_config.judge_temperature,
-                max_tokens=monitor_config.judge_max_tokens
+                system=system,
+                user=user,
+                temperature=temperature,
+                max_tokens=max_tokens
             )
-
-            # Parse response
-            return self._parse_response(response)
+            return self._after_call(response, cache_key, agent_key, digests)
 
         except LLMError as e:
             # LLM call failed, return None to trigger fallback
@@ -127,9 +352,63 @@ Be precise and avoid false positives.'''
             logger.exception("Unexpected error in %s judge: %s", self.risk_type, e)
             return None
 
+    async def _limited_call(
+        self, system: str, user: str, temperature: float, max_tokens: int
+    ) -> str:
+        """One client call under the process-wide rate limiter."""
+        async with get_judge_rate_limiter():
+            return await self.llm_client.agenerate_with_system(
+                system=system,
+                user=user,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+
+    async def _coalesced_call(
+        self, cache_key: str, system: str, user: str, temperature: float, max_tokens: int
+    ) -> str:
+        """Share one in-flight call among identical concurrent requests."""
+        task = self._inflight.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.get_running_loop().create_task(
+                self._limited_call(system, user, temperature, max_tokens)
+            )
+            LLMJudge._inflight[cache_key] = task
+            task.add_done_callback(
+                lambda _task: LLMJudge._inflight.pop(cache_key, None)
+            )
+        return await task
+
+    async def aanalyze(self, content: str, context: Optional[Dict] = None) -> Optional[JudgeResult]:
+        """Async twin of analyze(): awaits the client instead of blocking.
+
+        Lets a pipeline evaluate many judge-backed monitors concurrently
+        for one log entry — the workload is network-bound, so concurrent
+        calls reclaim the sequential round-trip time.
+        """
+        try:
+            request, cache_key, agent_key, digests, ready = self._before_call(content, context)
+            if request is None or ready is not None:
+                if ready is not None and agent_key and digests is not None:
+                    self._sessions[agent_key] = {"digests": set(digests), "verdict": ready}
+                return ready
+
+            system, user, temperature, max_tokens = request
+            response = await self._coalesced_call(
+                cache_key, system, user, temperature, max_tokens
+            )
+            return self._after_call(response, cache_key, agent_key, digests)
+
+        except LLMError as e:
+            logger.warning("LLM call failed for %s judge: %s", self.risk_type, e)
+            return None
+        except Exception as e:
+            logger.exception("Unexpected error in %s judge: %s", self.risk_type, e)
+            return None
+
     def _build_user_message(self, content: str, context: Optional[Dict]) -> str:
         """Build user message for LLM."""
-        parts = [f"Analyze this content for {self.risk_type} risks:\n\n{content}"]
+        parts = [self._user_preface + content]
 
         if context:
             context_str = "\n".join(f"- {k}: {v}" for k, v in context.items())
@@ -139,10 +418,6 @@ Be precise and avoid false positives.'''
 
     def _parse_response(self, response: str) -> Optional[JudgeResult]:
         """Parse LLM JSON response into JudgeResult."""
-        # Allowed values for validation
-        ALLOWED_SEVERITIES = ["none", "info", "warning", "critical"]
-        ALLOWED_ACTIONS = ["log", "warn", "block"]
-
         try:
             # Check if response is None or empty
             if response is None or not response:
@@ -152,32 +427,34 @@ Be precise and avoid false positives.'''
             # Try to extract JSON from response
             response = response.strip()
 
-            # Handle markdown code blocks
+            # Handle markdown code blocks (startswith prefilter keeps the
+            # common no-fence case off the regex engine entirely)
             if response.startswith("```"):
-                lines = response.split("\n")
-                json_lines = []
-                in_json = False
-                for line in lines:
-                    if line.startswith("```") and not in_json:
-                        in_json = True
-                        continue
-                    elif line.startswith("```") and in_json:
-                        break
-                    elif in_json:
-                        json_lines.append(line)
-                response = "\n".join(json_lines)
-
-            data = json.loads(response)
+                match = _FENCE_RE.match(response)
+                if match:
+                    response = match.group(1).strip()
+
+            # Completeness fast path: a truncated (still-streaming or
+            # max_tokens-cut) response can never parse, so skip the
+            # decoder and its exception entirely
+            if not response or response[-1] not in ("}", "]"):
+                logger.warning(
+                    "Incomplete LLM response for %s judge, skipping parse",
+                    self.risk_type
+                )
+                return None
+
+            data = _loads(response)
 
             # Validate and normalize severity
             severity = data.get("severity", "none")
-            if severity not in ALLOWED_SEVERITIES:
+            if severity not in self._ALLOWED_SEVERITIES:
                 logger.warning("Invalid severity '%s', defaulting to 'none'", severity)
                 severity = "none"
 
             # Validate and normalize recommended_action
             recommended_action = data.get("recommended_action", "log")
-            if recommended_action not in ALLOWED_ACTIONS:
+            if recommended_action not in self._ALLOWED_ACTIONS:
                 logger.warning("Invalid recommended_action '%s', defaulting to 'log'", recommended_action)
                 recommended_action = "log"
 
@@ -190,7 +467,8 @@ Be precise and avoid false positives.'''
                 raw_response=response,
                 judge_type="llm"
             )
-        except json.JSONDecodeError as e:
-            # Failed to parse, return None
+        except ValueError as e:
+            # Failed to parse, return None (orjson.JSONDecodeError and
+            # json.JSONDecodeError are both ValueError subclasses)
             logger.warning("Failed to parse LLM response as JSON: %s", e)
             return None
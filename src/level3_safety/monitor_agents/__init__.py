@@ -1,42 +1,20 @@
 """Monitor agents module."""
 
-from .base import BaseMonitorAgent, Alert
+import importlib
+
+from .base import BaseMonitorAgent, Alert, run_monitors_async
 
 # Re-export from judges module for backward compatibility
 from ..judges import LLMJudge, JudgeResult
 
-# L1 Layer - Single Agent Atomic Monitors
-from .jailbreak_monitor import JailbreakMonitor
-from .prompt_injection_monitor import PromptInjectionMonitor
-from .sensitive_disclosure_monitor import SensitiveDisclosureMonitor
-from .excessive_agency_monitor import ExcessiveAgencyMonitor
-from .code_execution_monitor import CodeExecutionMonitor
-from .hallucination_monitor import HallucinationMonitor
-from .memory_poisoning_monitor import MemoryPoisoningMonitor
-from .tool_misuse_monitor import ToolMisuseMonitor
-
-# L2 Layer - Inter-Agent Communication Monitors
-from .message_tampering_monitor import MessageTamperingMonitor
-from .malicious_propagation_monitor import MaliciousPropagationMonitor
-from .misinformation_amplify_monitor import MisinformationAmplifyMonitor
-from .insecure_output_monitor import InsecureOutputMonitor
-from .goal_drift_monitor import GoalDriftMonitor
-from .identity_spoofing_monitor import IdentitySpoofingMonitor
-
-# L3 Layer - System-Level Emergent Monitors
-from .cascading_failures_monitor import CascadingFailuresMonitor
-from .sandbox_escape_monitor import SandboxEscapeMonitor
-from .insufficient_monitoring_monitor import InsufficientMonitoringMonitor
-from .group_hallucination_monitor import GroupHallucinationMonitor
-from .malicious_emergence_monitor import MaliciousEmergenceMonitor
-from .rogue_agent_monitor import RogueAgentMonitor
-
 __all__ = [
     # Base classes
     "BaseMonitorAgent",
+    "run_monitors_async",
     "Alert",
     "LLMJudge",
     "JudgeResult",
+    "get_monitor",
     # L1 Layer
     "JailbreakMonitor",
     "PromptInjectionMonitor",
@@ -62,29 +40,61 @@ __all__ = [
     "RogueAgentMonitor",
 ]
 
-# Monitor registry for auto-loading
+# Monitor registry for auto-loading. Entries are (module, class) pairs
+# resolved on first use, so importing this package no longer pulls all
+# 20 monitor modules (and their judge/LLM-client chains) up front.
 MONITORS = {
     # L1 Layer
-    "jailbreak": JailbreakMonitor,
-    "prompt_injection": PromptInjectionMonitor,
-    "sensitive_disclosure": SensitiveDisclosureMonitor,
-    "excessive_agency": ExcessiveAgencyMonitor,
-    "code_execution": CodeExecutionMonitor,
-    "hallucination": HallucinationMonitor,
-    "memory_poisoning": MemoryPoisoningMonitor,
-    "tool_misuse": ToolMisuseMonitor,
+    "jailbreak": (".jailbreak_monitor", "JailbreakMonitor"),
+    "prompt_injection": (".prompt_injection_monitor", "PromptInjectionMonitor"),
+    "sensitive_disclosure": (".sensitive_disclosure_monitor", "SensitiveDisclosureMonitor"),
+    "excessive_agency": (".excessive_agency_monitor", "ExcessiveAgencyMonitor"),
+    "code_execution": (".code_execution_monitor", "CodeExecutionMonitor"),
+    "hallucination": (".hallucination_monitor", "HallucinationMonitor"),
+    "memory_poisoning": (".memory_poisoning_monitor", "MemoryPoisoningMonitor"),
+    "tool_misuse": (".tool_misuse_monitor", "ToolMisuseMonitor"),
     # L2 Layer
-    "message_tampering": MessageTamperingMonitor,
-    "malicious_propagation": MaliciousPropagationMonitor,
-    "misinformation_amplify": MisinformationAmplifyMonitor,
-    "insecure_output": InsecureOutputMonitor,
-    "goal_drift": GoalDriftMonitor,
-    "identity_spoofing": IdentitySpoofingMonitor,
+    "message_tampering": (".message_tampering_monitor", "MessageTamperingMonitor"),
+    "malicious_propagation": (".malicious_propagation_monitor", "MaliciousPropagationMonitor"),
+    "misinformation_amplify": (".misinformation_amplify_monitor", "MisinformationAmplifyMonitor"),
+    "insecure_output": (".insecure_output_monitor", "InsecureOutputMonitor"),
+    "goal_drift": (".goal_drift_monitor", "GoalDriftMonitor"),
+    "identity_spoofing": (".identity_spoofing_monitor", "IdentitySpoofingMonitor"),
     # L3 Layer
-    "cascading_failures": CascadingFailuresMonitor,
-    "sandbox_escape": SandboxEscapeMonitor,
-    "insufficient_monitoring": InsufficientMonitoringMonitor,
-    "group_hallucination": GroupHallucinationMonitor,
-    "malicious_emergence": MaliciousEmergenceMonitor,
-    "rogue_agent": RogueAgentMonitor,
+    "cascading_failures": (".cascading_failures_monitor", "CascadingFailuresMonitor"),
+    "sandbox_escape": (".sandbox_escape_monitor", "SandboxEscapeMonitor"),
+    "insufficient_monitoring": (".insufficient_monitoring_monitor", "InsufficientMonitoringMonitor"),
+    "group_hallucination": (".group_hallucination_monitor", "GroupHallucinationMonitor"),
+    "malicious_emergence": (".malicious_emergence_monitor", "MaliciousEmergenceMonitor"),
+    "rogue_agent": (".rogue_agent_monitor", "RogueAgentMonitor"),
 }
+
+_CLASS_TO_RISK = {class_name: risk for risk, (_mod, class_name) in MONITORS.items()}
+
+
+def get_monitor(name: str) -> type:
+    """Resolve a risk-type name to its monitor class, importing on demand.
+
+    Args:
+        name: Risk-type key from MONITORS (e.g. "jailbreak")
+
+    Returns:
+        The monitor class
+
+    Raises:
+        KeyError: If the risk type is not registered
+    """
+    module_name, class_name = MONITORS[name]
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name: str):
+    """PEP 562 hook so `from monitor_agents import JailbreakMonitor`
+    still works but only imports that monitor's module."""
+    risk_type = _CLASS_TO_RISK.get(name)
+    if risk_type is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    monitor_class = get_monitor(risk_type)
+    globals()[name] = monitor_class  # cache for subsequent lookups
+    return monitor_class
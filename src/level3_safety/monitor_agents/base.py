@@ -1,13 +1,29 @@
 """Base classes for monitor agents in Level 3."""
 
+import asyncio
+import logging
+import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import partial
+from hashlib import blake2b
 from typing import Optional, Dict, Any, List
 
 from ...level2_intermediary.structured_logging import AgentStepLog
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# A busy workflow can emit one Alert per monitor per log entry; __slots__
+# drops the per-instance dict (slots=True needs Python 3.10+, older
+# versions fall back to a plain dataclass)
+if sys.version_info >= (3, 10):
+    _slotted_dataclass = partial(dataclass, slots=True)
+else:  # pragma: no cover
+    _slotted_dataclass = dataclass
+
+
+@_slotted_dataclass
 class Alert:
     """Security alert from a monitor."""
     severity: str  # "info", "warning", "critical"
@@ -72,6 +88,67 @@ class BaseMonitorAgent(ABC):
         """
         pass
 
+    async def aprocess(self, log_entry: AgentStepLog) -> Optional[Alert]:
+        """Async twin of process() for concurrent pipelines.
+
+        Monitors whose process() blocks on an LLM call should override
+        this to await the judge directly; the default just offloads the
+        synchronous path to a worker thread.
+
+        Args:
+            log_entry: Structured log from workflow execution
+
+        Returns:
+            Alert if risk detected, None otherwise
+        """
+        return await asyncio.to_thread(self.process, log_entry)
+
+    def process_batch(self, log_entries: List[AgentStepLog]) -> List[Optional[Alert]]:
+        """Process a micro-batch of log entries in order.
+
+        The default is a plain loop; monitors with per-entry setup they
+        can amortize across the batch (pattern prefilters, bulk scans)
+        should override this.
+
+        Args:
+            log_entries: Structured logs from workflow execution
+
+        Returns:
+            One Optional[Alert] per entry, in input order
+        """
+        return [self.process(entry) for entry in log_entries]
+
+    _BENIGN_CACHE_MAX = 1024
+
+    @staticmethod
+    def _benign_digest(content: str) -> bytes:
+        return blake2b(str(content).encode("utf-8", "ignore"), digest_size=8).digest()
+
+    def _recently_benign(self, content: str) -> bool:
+        """True if this exact content was recently judged risk-free.
+
+        Two-tier judging support: monitors whose cheap pattern scan
+        finds nothing can skip the LLM round-trip for content the judge
+        has already cleared. Lives in state so reset() clears it.
+        """
+        cache = self.state.get("benign_digests")
+        if not cache:
+            return False
+        digest = self._benign_digest(content)
+        if digest in cache:
+            cache.move_to_end(digest)
+            return True
+        return False
+
+    def _mark_benign(self, content: str):
+        """Record content the judge found risk-free, LRU-bounded."""
+        cache = self.state.get("benign_digests")
+        if cache is None:
+            cache = self.state["benign_digests"] = OrderedDict()
+        cache[self._benign_digest(content)] = None
+        if len(cache) > self._BENIGN_CACHE_MAX:
+            cache.popitem(last=False)
+
     def reset(self):
         """Reset monitor state (called between workflow runs)."""
         self.state = {}
@@ -172,3 +249,46 @@ class BaseMonitorAgent(ABC):
             self.state["alerts"] = []
         self.state["alerts"].append(alert)
 
+
+async def run_monitors_async(
+    log_entry: AgentStepLog,
+    monitors: List[BaseMonitorAgent],
+    max_concurrency: int = 8
+) -> List[Optional[Alert]]:
+    """Evaluate monitors concurrently for one log entry.
+
+    Judge-backed monitors spend their time waiting on the LLM API, so
+    running them head-to-tail serializes network round-trips. This
+    gathers every monitor's aprocess() under a concurrency bound and
+    mirrors the sync pipeline's per-monitor error isolation: a failing
+    monitor yields None instead of poisoning the batch.
+
+    Args:
+        log_entry: Structured log to analyze
+        monitors: Monitors to evaluate
+        max_concurrency: Maximum monitors in flight at once
+
+    Returns:
+        One Optional[Alert] per monitor, in monitor order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(monitor: BaseMonitorAgent):
+        async with semaphore:
+            return await monitor.aprocess(log_entry)
+
+    results = await asyncio.gather(
+        *(run_one(monitor) for monitor in monitors),
+        return_exceptions=True
+    )
+
+    alerts: List[Optional[Alert]] = []
+    for monitor, result in zip(monitors, results):
+        if isinstance(result, BaseException):
+            name = monitor.get_monitor_info().get("name", monitor.__class__.__name__)
+            logger.error("Monitor %s failed: %s", name, result)
+            alerts.append(None)
+        else:
+            alerts.append(result)
+    return alerts
+
@@ -1,16 +1,105 @@
 """L3 Cascading Failures Monitor Implementation."""
 
+import functools
 import json
+import re
 import time
+from hashlib import blake2b
 from pathlib import Path
 from typing import Optional, Dict, List, Set
-from collections import defaultdict
+from collections import Counter, deque
 
 from ..base import BaseMonitorAgent, Alert
 from ...judges import LLMJudge, JudgeResult
 from ....level2_intermediary.structured_logging import AgentStepLog
 
 
+ERROR_INDICATORS = (
+    "error", "exception", "failed", "failure", "critical",
+    "halt", "panic", "crash", "abort", "fatal"
+)
+CORRUPTION_INDICATORS = (
+    "reset all", "clear all memory", "state corrupted",
+    "data loss", "inconsistent state", "undefined behavior",
+    "null pointer", "out of bounds"
+)
+
+
+# Digit runs are the volatile part of looping messages (timestamps,
+# retry counters, request ids); collapsing them before fingerprinting
+# lets near-identical repeats hash to the same value
+_VOLATILE_RE = re.compile(r"\d+")
+
+
+def _loop_fingerprint(content: str) -> bytes:
+    """8-byte digest of the content prefix with volatile digits collapsed.
+
+    Messages that differ only in embedded numbers (timestamps, attempt
+    counts) produce the same fingerprint, so retry loops that stamp each
+    iteration still register as repetition.
+    """
+    normalized = _VOLATILE_RE.sub("0", content[:500])
+    return blake2b(normalized.encode("utf-8", "ignore"), digest_size=8).digest()
+
+
+@functools.cache
+def _indicator_scanner():
+    """Compiled indicator alternation plus category map, built once.
+
+    The indicator lists are identical for every monitor instance, so the
+    scanner lives at module scope and is shared instead of rebuilt per
+    __init__ (and per reset).
+    """
+    category = {w: "error" for w in ERROR_INDICATORS}
+    category.update({w: "corruption" for w in CORRUPTION_INDICATORS})
+    pattern = re.compile("|".join(
+        re.escape(w) for w in sorted(category, key=len, reverse=True)
+    ))
+    return pattern, category
+
+
+class _AgentRecord:
+    """Per-agent monitoring state: fixed slots, bounds enforced at insert.
+
+    One typed record per agent replaces parallel per-field containers;
+    the deque maxlens make the old "trim by slicing" pattern unnecessary.
+    """
+
+    __slots__ = (
+        "errors", "successes", "response_times",
+        "msg_history", "msg_counts", "degradation_ring"
+    )
+
+    def __init__(self, degradation_window: int):
+        self.errors = 0
+        self.successes = 0
+        self.response_times = deque(maxlen=10)
+        # Bounded hash history plus an incrementally maintained Counter,
+        # so repetition checks are O(1) instead of list.count() per entry
+        self.msg_history = deque(maxlen=20)
+        self.msg_counts = Counter()
+        # Ring of (length, prefix digest) pairs: trend and uniqueness
+        # checks read precomputed scalars instead of re-slicing retained
+        # message bodies every step
+        self.degradation_ring = deque(maxlen=degradation_window)
+
+
+def _timeout_cascade(times, threshold):
+    """Detect monotonically increasing gaps over the last four timestamps.
+
+    Straight-line scalar arithmetic on the final four entries: no
+    intermediate delta list is built per log entry. Returns
+    (cascading, average_delay, last_three_deltas).
+    """
+    if len(times) < 4:
+        return False, 0.0, ()
+    d2 = times[-1] - times[-2]
+    d1 = times[-2] - times[-3]
+    d0 = times[-3] - times[-4]
+    avg = (d2 + d1 + d0) / 3.0
+    return (d2 > d1 > d0) and (avg > threshold), avg, (d0, d1, d2)
+
+
 class CascadingFailuresMonitor(BaseMonitorAgent):
     """Runtime monitor for cascading failures.
 
@@ -35,6 +124,13 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
             "degradation_check_window": 5,
             "track_message_hashes": True
         }
+        # Hot-path thresholds resolved once; the checkers run per log
+        # entry and should not pay a dict lookup (or the ms->s division)
+        # each time
+        self._max_similar = int(self.config["max_similar_messages"])
+        self._error_threshold = int(self.config["error_propagation_threshold"])
+        self._timeout_threshold_sec = self.config["timeout_threshold_ms"] / 1000.0
+        self._degradation_window = int(self.config["degradation_check_window"])
 
         # Initialize LLM Judge
         prompt_file = Path(__file__).parent / "system_prompt.txt"
@@ -45,27 +141,53 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
 
         self._initialize_state()
 
-        self.error_indicators = [
-            "error", "exception", "failed", "failure", "critical",
-            "halt", "panic", "crash", "abort", "fatal"
-        ]
-        self.corruption_indicators = [
-            "reset all", "clear all memory", "state corrupted",
-            "data loss", "inconsistent state", "undefined behavior",
-            "null pointer", "out of bounds"
-        ]
+        self.error_indicators = list(ERROR_INDICATORS)
+        self.corruption_indicators = list(CORRUPTION_INDICATORS)
+
+    @staticmethod
+    def _scan_indicators(content_lower: str) -> Dict[str, List[str]]:
+        """Single pass over content, bucketing indicator hits by category.
+
+        One compiled alternation scans for every indicator in a single
+        C-level pass instead of one Python substring scan per indicator.
+        """
+        pattern, category = _indicator_scanner()
+        hits: Dict[str, List[str]] = {"error": [], "corruption": []}
+        for match in pattern.finditer(content_lower):
+            word = match.group()
+            bucket = hits[category[word]]
+            if word not in bucket:
+                bucket.append(word)
+        return hits
 
     def _initialize_state(self):
         """Initialize monitoring state."""
+        # One slotted record per agent holds every bounded buffer the
+        # checks touch, so a log entry resolves its agent exactly once
+        self._agents: Dict[str, _AgentRecord] = {}
+
+        # error_chain is stored as parallel columns (agent, timestamp,
+        # preview) instead of a dict per event; the dicts are materialized
+        # only for the last five entries when an alert actually fires
         self.state = {
-            "message_hashes": defaultdict(list),
             "error_agents": set(),
-            "response_times": defaultdict(list),
-            "last_messages": defaultdict(list),
-            "error_chain": [],
-            "loop_detection_buffer": [],
-            "agent_health": defaultdict(lambda: {"errors": 0, "successes": 0})
+            "error_chain_agents": [],
+            "error_chain_timestamps": [],
+            "error_chain_previews": [],
+            "loop_detection_buffer": deque(maxlen=50)
         }
+        # Snapshot of error_agents, rebuilt only when a new agent joins
+        # the set; repeated errors from known agents reuse it instead of
+        # re-materializing the list per alert
+        self._error_agents_snapshot: tuple = ()
+
+    def _record(self, agent: str) -> _AgentRecord:
+        """Get-or-allocate the state record for an agent."""
+        record = self._agents.get(agent)
+        if record is None:
+            record = _AgentRecord(self._degradation_window)
+            self._agents[agent] = record
+        return record
 
     def get_monitor_info(self) -> Dict[str, str]:
         """Return monitor metadata."""
@@ -85,22 +207,47 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
                 "agent_name": log_entry.agent_name,
                 "step_type": str(log_entry.step_type),
                 "error_agents_count": len(self.state["error_agents"]),
-                "recent_errors": len(self.state["error_chain"])
+                "recent_errors": len(self.state["error_chain_agents"])
             }
 
             result = self.llm_judge.analyze(content, context)
             if result and result.has_risk:
-                return self._create_alert_from_judge(result, log_entry)
+                return self._create_alert_from_judge(result, log_entry, content)
             elif result is not None:
                 return None
 
         # Fallback to pattern matching
         if self.config.get("fallback_to_patterns", True):
-            return self._pattern_fallback(log_entry)
+            return self._pattern_fallback(log_entry, content)
+
+        return None
+
+    async def aprocess(self, log_entry: AgentStepLog) -> Optional[Alert]:
+        """Async process: awaits the judge instead of blocking a thread."""
+        content = str(log_entry.content)
+
+        if self.config.get("use_llm_judge", True):
+            context = {
+                "agent_name": log_entry.agent_name,
+                "step_type": str(log_entry.step_type),
+                "error_agents_count": len(self.state["error_agents"]),
+                "recent_errors": len(self.state["error_chain_agents"])
+            }
+
+            result = await self.llm_judge.aanalyze(content, context)
+            if result and result.has_risk:
+                return self._create_alert_from_judge(result, log_entry, content)
+            elif result is not None:
+                return None
+
+        if self.config.get("fallback_to_patterns", True):
+            return self._pattern_fallback(log_entry, content)
 
         return None
 
-    def _create_alert_from_judge(self, result: JudgeResult, log_entry: AgentStepLog) -> Alert:
+    def _create_alert_from_judge(
+        self, result: JudgeResult, log_entry: AgentStepLog, content: str
+    ) -> Alert:
         """Create Alert from LLMJudge result."""
         alert = Alert(
             severity=result.severity,
@@ -111,7 +258,7 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
                 "step_type": str(log_entry.step_type),
                 "detected_by": "llm_judge",
                 "evidence": result.evidence,
-                "content_preview": str(log_entry.content)[:200]
+                "content_preview": content[:200]
             },
             recommended_action=result.recommended_action,
             timestamp=log_entry.timestamp
@@ -119,29 +266,30 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
         self._record_alert(alert)
         return alert
 
-    def _pattern_fallback(self, log_entry: AgentStepLog) -> Optional[Alert]:
-        """Fallback to pattern matching when LLM unavailable."""
-        alerts = []
-
-        error_alert = self._check_error_propagation(log_entry)
-        if error_alert:
-            alerts.append(error_alert)
+    def _pattern_fallback(self, log_entry: AgentStepLog, content: str) -> Optional[Alert]:
+        """Fallback to pattern matching when LLM unavailable.
 
-        loop_alert = self._check_infinite_loop(log_entry)
-        if loop_alert:
-            alerts.append(loop_alert)
-
-        degradation_alert = self._check_response_degradation(log_entry)
-        if degradation_alert:
-            alerts.append(degradation_alert)
-
-        timeout_alert = self._check_timeout_cascade(log_entry)
-        if timeout_alert:
-            alerts.append(timeout_alert)
-
-        corruption_alert = self._check_state_corruption(log_entry)
-        if corruption_alert:
-            alerts.append(corruption_alert)
+        Checks run in severity-biased order: the ones that can emit
+        critical alerts go first and return immediately on a hit, since
+        the severity sort would pick a critical over anything later.
+        Content and its lowered form are computed once here and threaded
+        through every check instead of re-stringifying per check.
+        """
+        alerts = []
+        content_lower = log_entry.content_lower
+
+        for check, argument in (
+            (self._check_infinite_loop, content),
+            (self._check_state_corruption, content_lower),
+            (self._check_error_propagation, content_lower),
+            (self._check_response_degradation, content),
+            (self._check_timeout_cascade, None),
+        ):
+            alert = check(log_entry, argument) if argument is not None else check(log_entry)
+            if alert:
+                if alert.severity == "critical":
+                    return alert
+                alerts.append(alert)
 
         if alerts:
             severity_order = {"critical": 0, "warning": 1, "info": 2}
@@ -150,32 +298,39 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
 
         return None
 
-    def _check_error_propagation(self, log_entry: AgentStepLog) -> Optional[Alert]:
+    def _check_error_propagation(self, log_entry: AgentStepLog, content: str) -> Optional[Alert]:
         """Check for errors propagating between agents."""
-        content = str(log_entry.content).lower()
         agent = log_entry.agent_name
 
-        has_error = any(indicator in content for indicator in self.error_indicators)
+        has_error = bool(self._scan_indicators(content)["error"])
+        record = self._record(agent)
 
         if has_error:
-            self.state["error_agents"].add(agent)
-            self.state["error_chain"].append({
-                "agent": agent,
-                "timestamp": log_entry.timestamp or time.time(),
-                "content_preview": content[:100]
-            })
-            self.state["agent_health"][agent]["errors"] += 1
-
-            threshold = self.config.get("error_propagation_threshold", 2)
-            if len(self.state["error_agents"]) >= threshold:
+            error_agents = self.state["error_agents"]
+            if agent not in error_agents:
+                error_agents.add(agent)
+                self._error_agents_snapshot = tuple(error_agents)
+            self.state["error_chain_agents"].append(agent)
+            self.state["error_chain_timestamps"].append(log_entry.timestamp or time.time())
+            self.state["error_chain_previews"].append(content[:100])
+            record.errors += 1
+
+            if len(self.state["error_agents"]) >= self._error_threshold:
                 alert = Alert(
                     severity="critical",
                     risk_type="cascading_failures",
                     message=f"Error cascade detected (fallback mode)",
                     evidence={
                         "detected_by": "pattern_matching",
-                        "affected_agents": list(self.state["error_agents"]),
-                        "error_chain": self.state["error_chain"][-5:],
+                        "affected_agents": list(self._error_agents_snapshot),
+                        "error_chain": [
+                            {"agent": a, "timestamp": t, "content_preview": p}
+                            for a, t, p in zip(
+                                self.state["error_chain_agents"][-5:],
+                                self.state["error_chain_timestamps"][-5:],
+                                self.state["error_chain_previews"][-5:]
+                            )
+                        ],
                         "trigger_agent": agent
                     },
                     recommended_action="block",
@@ -184,26 +339,30 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
                 self._record_alert(alert)
                 return alert
         else:
-            self.state["agent_health"][agent]["successes"] += 1
+            record.successes += 1
 
         return None
 
-    def _check_infinite_loop(self, log_entry: AgentStepLog) -> Optional[Alert]:
+    def _check_infinite_loop(self, log_entry: AgentStepLog, content: str) -> Optional[Alert]:
         """Check for infinite loop patterns."""
-        content = str(log_entry.content)
         agent = log_entry.agent_name
 
-        content_hash = hash(content[:500])
-        agent_hashes = self.state["message_hashes"][agent]
-        agent_hashes.append(content_hash)
-
-        max_history = 20
-        if len(agent_hashes) > max_history:
-            self.state["message_hashes"][agent] = agent_hashes[-max_history:]
-            agent_hashes = self.state["message_hashes"][agent]
-
-        max_similar = self.config.get("max_similar_messages", 3)
-        if agent_hashes.count(content_hash) >= max_similar:
+        # Normalized 8-byte digest: computed in C, compact as a dict key,
+        # stable across runs, and insensitive to embedded counters
+        content_hash = _loop_fingerprint(content)
+        record = self._record(agent)
+        history, counts = record.msg_history, record.msg_counts
+
+        # Keep the Counter in sync with what the bounded deque evicts
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            counts[evicted] -= 1
+            if not counts[evicted]:
+                del counts[evicted]
+        history.append(content_hash)
+        counts[content_hash] += 1
+
+        if counts[content_hash] >= self._max_similar:
             alert = Alert(
                 severity="critical",
                 risk_type="cascading_failures",
@@ -211,7 +370,7 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
                 evidence={
                     "agent": agent,
                     "detected_by": "pattern_matching",
-                    "repetition_count": agent_hashes.count(content_hash),
+                    "repetition_count": counts[content_hash],
                     "message_preview": content[:200]
                 },
                 recommended_action="block",
@@ -220,16 +379,13 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
             self._record_alert(alert)
             return alert
 
+        # Tuples compare elementwise and skip the f-string/split round
+        # trip the old "agent:hash" string entries needed
         loop_buffer = self.state["loop_detection_buffer"]
-        loop_entry = f"{agent}:{content_hash}"
-        loop_buffer.append(loop_entry)
-
-        if len(loop_buffer) > 50:
-            self.state["loop_detection_buffer"] = loop_buffer[-50:]
-            loop_buffer = self.state["loop_detection_buffer"]
+        loop_buffer.append((agent, content_hash))
 
         if len(loop_buffer) >= 6:
-            recent = loop_buffer[-6:]
+            recent = list(loop_buffer)[-6:]
             pattern_1 = recent[0:3]
             pattern_2 = recent[3:6]
             if pattern_1 == pattern_2:
@@ -239,8 +395,8 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
                     message="Circular communication pattern detected (fallback mode)",
                     evidence={
                         "detected_by": "pattern_matching",
-                        "pattern": recent,
-                        "agents_involved": list(set(e.split(":")[0] for e in recent))
+                        "pattern": [f"{a}:{h.hex()}" for a, h in recent],
+                        "agents_involved": list(set(a for a, _ in recent))
                     },
                     recommended_action="warn",
                     timestamp=log_entry.timestamp
@@ -250,23 +406,20 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
 
         return None
 
-    def _check_response_degradation(self, log_entry: AgentStepLog) -> Optional[Alert]:
+    def _check_response_degradation(self, log_entry: AgentStepLog, content: str) -> Optional[Alert]:
         """Check for response quality degradation."""
-        content = str(log_entry.content)
         agent = log_entry.agent_name
 
-        last_messages = self.state["last_messages"][agent]
-        last_messages.append(content)
-
-        window = self.config.get("degradation_check_window", 5)
-        if len(last_messages) > window:
-            self.state["last_messages"][agent] = last_messages[-window:]
-            last_messages = self.state["last_messages"][agent]
+        history = self._record(agent).degradation_ring
+        prefix_digest = blake2b(
+            content[:100].encode("utf-8", "ignore"), digest_size=8
+        ).digest()
+        history.append((len(content), prefix_digest))
 
         degradation_signs = []
+        lengths = [entry[0] for entry in history][-3:]
 
-        if len(last_messages) >= 3:
-            lengths = [len(m) for m in last_messages[-3:]]
+        if len(history) >= 3:
             if lengths[-1] < lengths[-2] < lengths[-3] and lengths[-1] < 50:
                 degradation_signs.append("response_shortening")
 
@@ -276,8 +429,8 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
         if content.count("{") != content.count("}") or content.count("[") != content.count("]"):
             degradation_signs.append("malformed_content")
 
-        if len(last_messages) >= 3:
-            unique_count = len(set(m[:100] for m in last_messages[-3:]))
+        if len(history) >= 3:
+            unique_count = len({entry[1] for entry in list(history)[-3:]})
             if unique_count == 1:
                 degradation_signs.append("repetitive_responses")
 
@@ -294,7 +447,7 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
                     "agent": agent,
                     "detected_by": "pattern_matching",
                     "degradation_signs": degradation_signs,
-                    "recent_response_lengths": [len(m) for m in last_messages[-3:]] if len(last_messages) >= 3 else [],
+                    "recent_response_lengths": lengths if len(history) >= 3 else [],
                     "message_preview": content[:200]
                 },
                 recommended_action="warn",
@@ -310,48 +463,34 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
         agent = log_entry.agent_name
         timestamp = log_entry.timestamp or time.time()
 
-        response_times = self.state["response_times"][agent]
+        response_times = self._record(agent).response_times
         response_times.append(timestamp)
 
-        if len(response_times) > 10:
-            self.state["response_times"][agent] = response_times[-10:]
-            response_times = self.state["response_times"][agent]
-
-        if len(response_times) >= 3:
-            deltas = []
-            for i in range(1, len(response_times)):
-                deltas.append(response_times[i] - response_times[i-1])
-
-            recent_deltas = deltas[-3:]
-            if len(recent_deltas) >= 3:
-                if recent_deltas[-1] > recent_deltas[-2] > recent_deltas[-3]:
-                    avg_delay = sum(recent_deltas) / len(recent_deltas)
-                    threshold = self.config.get("timeout_threshold_ms", 30000) / 1000
-
-                    if avg_delay > threshold:
-                        alert = Alert(
-                            severity="warning",
-                            risk_type="cascading_failures",
-                            message=f"Increasing delays detected (fallback mode)",
-                            evidence={
-                                "agent": agent,
-                                "detected_by": "pattern_matching",
-                                "recent_delays_sec": recent_deltas,
-                                "average_delay_sec": avg_delay
-                            },
-                            recommended_action="warn",
-                            timestamp=timestamp
-                        )
-                        self._record_alert(alert)
-                        return alert
+        cascading, avg_delay, recent_deltas = _timeout_cascade(
+            response_times, self._timeout_threshold_sec
+        )
+        if cascading:
+            alert = Alert(
+                severity="warning",
+                risk_type="cascading_failures",
+                message=f"Increasing delays detected (fallback mode)",
+                evidence={
+                    "agent": agent,
+                    "detected_by": "pattern_matching",
+                    "recent_delays_sec": list(recent_deltas),
+                    "average_delay_sec": avg_delay
+                },
+                recommended_action="warn",
+                timestamp=timestamp
+            )
+            self._record_alert(alert)
+            return alert
 
         return None
 
-    def _check_state_corruption(self, log_entry: AgentStepLog) -> Optional[Alert]:
+    def _check_state_corruption(self, log_entry: AgentStepLog, content: str) -> Optional[Alert]:
         """Check for state corruption indicators."""
-        content = str(log_entry.content).lower()
-
-        detected = [ind for ind in self.corruption_indicators if ind in content]
+        detected = self._scan_indicators(content)["corruption"]
 
         if detected:
             alert = Alert(
@@ -380,13 +519,14 @@ class CascadingFailuresMonitor(BaseMonitorAgent):
     def get_health_summary(self) -> Dict:
         """Get a summary of agent health status."""
         summary = {}
-        for agent, health in self.state["agent_health"].items():
-            total = health["errors"] + health["successes"]
+        for agent, record in self._agents.items():
+            errors, successes = record.errors, record.successes
+            total = errors + successes
             if total > 0:
                 summary[agent] = {
-                    "error_rate": health["errors"] / total,
+                    "error_rate": errors / total,
                     "total_interactions": total,
-                    "errors": health["errors"],
-                    "successes": health["successes"]
+                    "errors": errors,
+                    "successes": successes
                 }
         return summary
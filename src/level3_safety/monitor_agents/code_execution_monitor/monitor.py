@@ -1,5 +1,6 @@
 """L1 Code Execution Monitor Implementation."""
 
+import functools
 import json
 import re
 from pathlib import Path
@@ -9,6 +10,16 @@ from ..base import BaseMonitorAgent, Alert
 from ...judges import LLMJudge, JudgeResult
 from ....level2_intermediary.structured_logging import AgentStepLog
 
+# hyperscan is optional: when installed, the whole pattern set compiles
+# into one SIMD-executed database; otherwise the fused regex path below
+# handles scanning
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_PATTERNS_PATH = Path(__file__).parent / "patterns.json"
+
 
 class CodeExecutionMonitor(BaseMonitorAgent):
     """Runtime monitor for unauthorized code execution.
@@ -38,9 +49,92 @@ class CodeExecutionMonitor(BaseMonitorAgent):
             system_prompt_file=prompt_file
         )
 
-        self.dangerous_patterns = self._load_patterns()
+        # All instances share one compiled scan structure; the mtime key
+        # invalidates the cache if patterns.json changes between inits
+        mtime = _PATTERNS_PATH.stat().st_mtime if _PATTERNS_PATH.exists() else 0.0
+        (self.dangerous_patterns, self._fused_re, self._group_to_type,
+         self._hs_db, self._hs_patterns, self._triggers) = _compiled_scan_state(mtime)
         self.dangerous_tools = ["execute", "shell", "run", "eval", "exec"]
 
+    @staticmethod
+    def _fuse_patterns(patterns: Dict[str, List[str]]):
+        """Fuse every category into one alternation with a group per category.
+
+        Groups get synthetic names (g0, g1, ...) so arbitrary category
+        keys from patterns.json cannot clash with group-name syntax; the
+        returned map translates lastgroup back to the category.
+        """
+        groups = []
+        group_to_type = {}
+        for index, (threat_type, category_patterns) in enumerate(patterns.items()):
+            if not category_patterns:
+                continue
+            name = f"g{index}"
+            group_to_type[name] = threat_type
+            alternation = "|".join(f"(?:{p})" for p in category_patterns)
+            groups.append(f"(?P<{name}>{alternation})")
+        return re.compile("|".join(groups), re.IGNORECASE), group_to_type
+
+    @staticmethod
+    def _literal_triggers(patterns: Dict[str, List[str]]) -> Optional[frozenset]:
+        """Leading literal of each pattern, for a cheap pre-regex skip test.
+
+        Most log entries contain none of the dangerous patterns, so a
+        handful of C-level substring tests can rule out the full scan.
+        Returns None (prefilter disabled) if any pattern starts with a
+        metacharacter and therefore has no extractable literal — the
+        prefilter must never cause a miss.
+        """
+        meta = set(".^$*+?{}[]()|")
+        triggers = set()
+        for category_patterns in patterns.values():
+            for pattern in category_patterns:
+                literal = []
+                chars = iter(pattern)
+                for ch in chars:
+                    if ch == "\\":
+                        escaped = next(chars, "")
+                        if escaped.isalnum():  # \s, \d, \w... are classes
+                            break
+                        literal.append(escaped)
+                    elif ch in meta:
+                        break
+                    else:
+                        literal.append(ch)
+                if not literal:
+                    return None
+                triggers.add("".join(literal).lower())
+        # Drop triggers that contain a shorter one: the substring test
+        # for the shorter trigger already covers them
+        minimal = []
+        for trigger in sorted(triggers, key=len):
+            if not any(kept in trigger for kept in minimal):
+                minimal.append(trigger)
+        return frozenset(minimal)
+
+    @staticmethod
+    def _build_hyperscan(patterns: Dict[str, List[str]]):
+        """Compile the pattern set into a Hyperscan database when available.
+
+        Returns (db, flat_patterns) where flat_patterns maps the compiled
+        expression ids back to (type, pattern); (None, ()) when hyperscan
+        is not installed or rejects an expression, in which case the
+        fused-regex path is used instead.
+        """
+        if hyperscan is None:
+            return None, ()
+        flat = [(t, p) for t, pats in patterns.items() for p in pats]
+        db = hyperscan.Database()
+        try:
+            db.compile(
+                expressions=[p.encode() for _, p in flat],
+                ids=list(range(len(flat))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(flat),
+            )
+        except hyperscan.error:
+            return None, ()
+        return db, tuple(flat)
+
     def get_monitor_info(self) -> Dict[str, str]:
         return {
             "name": "CodeExecutionMonitor",
@@ -48,11 +142,11 @@ class CodeExecutionMonitor(BaseMonitorAgent):
             "description": "Monitors for unauthorized code execution attempts using LLM analysis"
         }
 
-    def _load_patterns(self) -> Dict[str, List[str]]:
-        patterns_path = Path(__file__).parent / "patterns.json"
-        if patterns_path.exists():
+    @staticmethod
+    def _load_patterns() -> Dict[str, List[str]]:
+        if _PATTERNS_PATH.exists():
             try:
-                with open(patterns_path, 'r', encoding='utf-8') as f:
+                with open(_PATTERNS_PATH, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except json.JSONDecodeError:
                 pass
@@ -105,6 +199,51 @@ class CodeExecutionMonitor(BaseMonitorAgent):
 
         return None
 
+    async def aprocess(self, log_entry: AgentStepLog) -> Optional[Alert]:
+        """Async process: awaits the judge instead of blocking a thread."""
+        content = str(log_entry.content)
+
+        if self.config.get("use_llm_judge", True):
+            context = {
+                "agent_name": log_entry.agent_name,
+                "step_type": str(log_entry.step_type),
+                "tool_name": log_entry.metadata.get("tool_name", "") if log_entry.step_type == "tool_call" else ""
+            }
+
+            result = await self.llm_judge.aanalyze(content, context)
+            if result and result.has_risk:
+                return self._create_alert_from_judge(result, log_entry)
+            elif result is not None:
+                return None
+
+        if self.config.get("fallback_to_patterns", True):
+            return self._pattern_fallback(log_entry)
+
+        return None
+
+    def process_batch(self, log_entries: List[AgentStepLog]) -> List[Optional[Alert]]:
+        """Batch path: one prefilter pass can clear a whole micro-batch.
+
+        In pattern-fallback mode every detection path funnels through
+        _detect_patterns, so if none of the trigger literals occur
+        anywhere in the batch's contents and tool params, no entry can
+        alert and the per-entry checks are skipped entirely. Judge-
+        enabled batches still go entry by entry — the judge layer does
+        its own batching.
+        """
+        if self.config.get("use_llm_judge", True) or self._triggers is None:
+            return [self.process(entry) for entry in log_entries]
+
+        joined = "\n\x00\n".join(
+            str(entry.metadata.get("params", "")) if entry.step_type == "tool_call"
+            else str(entry.content)
+            for entry in log_entries
+        ).lower()
+        if not any(trigger in joined for trigger in self._triggers):
+            return [None] * len(log_entries)
+
+        return [self.process(entry) for entry in log_entries]
+
     def _create_alert_from_judge(self, result: JudgeResult, log_entry: AgentStepLog) -> Alert:
         """Create Alert from LLMJudge result."""
         alert = Alert(
@@ -190,15 +329,52 @@ class CodeExecutionMonitor(BaseMonitorAgent):
         return None
 
     def _detect_patterns(self, content: str) -> List[Dict]:
-        threats = []
-        content_lower = content.lower()
+        """Classify dangerous hits in one linear scan of the content.
+
+        The fused alternation replaces ~25 separate re.search passes,
+        and re.IGNORECASE makes the old explicit .lower() copy
+        unnecessary. Hits are deduplicated by (type, matched text).
+        """
+        # Fast negative path: if none of the patterns' leading literals
+        # occur, nothing can match and the scan is skipped entirely
+        if self._triggers is not None:
+            lowered = content.lower()
+            if not any(trigger in lowered for trigger in self._triggers):
+                return []
+
+        if self._hs_db is not None:
+            hit_ids = set()
+            self._hs_db.scan(
+                content.encode("utf-8", "ignore"),
+                match_event_handler=lambda pid, start, end, flags, ctx: hit_ids.add(pid),
+            )
+            return [
+                {"type": self._hs_patterns[pid][0], "pattern": self._hs_patterns[pid][1]}
+                for pid in sorted(hit_ids)
+            ]
 
-        for threat_type, patterns in self.dangerous_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    threats.append({
-                        "type": threat_type,
-                        "pattern": pattern
-                    })
+        threats = []
+        seen = set()
+        for match in self._fused_re.finditer(content):
+            threat = (self._group_to_type[match.lastgroup], match.group())
+            if threat not in seen:
+                seen.add(threat)
+                threats.append({"type": threat[0], "pattern": threat[1]})
 
         return threats
+
+
+@functools.cache
+def _compiled_scan_state(patterns_mtime: float):
+    """Pattern set plus every derived scan structure, built once per file.
+
+    Safety setups instantiate this monitor per tenant/workflow; keying
+    on the patterns.json mtime lets all of them share one fused regex,
+    Hyperscan database and trigger set while still picking up an edited
+    pattern file on the next init.
+    """
+    patterns = CodeExecutionMonitor._load_patterns()
+    fused_re, group_to_type = CodeExecutionMonitor._fuse_patterns(patterns)
+    hs_db, hs_patterns = CodeExecutionMonitor._build_hyperscan(patterns)
+    triggers = CodeExecutionMonitor._literal_triggers(patterns)
+    return patterns, fused_re, group_to_type, hs_db, hs_patterns, triggers
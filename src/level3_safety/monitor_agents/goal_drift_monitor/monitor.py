@@ -1,6 +1,8 @@
 """L2 Goal Drift Monitor Implementation."""
 
+import functools
 import json
+import re
 from pathlib import Path
 from typing import Optional, Dict, List
 
@@ -9,6 +11,33 @@ from ...judges import LLMJudge, JudgeResult
 from ....level2_intermediary.structured_logging import AgentStepLog
 
 
+DRIFT_PATTERNS = (
+    "new objective", "changing goal", "new priority",
+    "forget the original", "skip the", "ignore the",
+    "let's also", "while we're at it"
+)
+SAFETY_ABANDONMENT = (
+    "skip validation", "ignore safety", "bypass check",
+    "no need for security", "speed over safety"
+)
+
+
+@functools.cache
+def _drift_scanner():
+    """Compiled pattern alternation plus category map, built once.
+
+    Both indicator lists scan in a single C-level pass instead of one
+    Python substring search per pattern; the scanner is shared by every
+    monitor instance.
+    """
+    category = {w: "drift" for w in DRIFT_PATTERNS}
+    category.update({w: "safety" for w in SAFETY_ABANDONMENT})
+    pattern = re.compile("|".join(
+        re.escape(w) for w in sorted(category, key=len, reverse=True)
+    ))
+    return pattern, category
+
+
 class GoalDriftMonitor(BaseMonitorAgent):
     """Runtime monitor for goal drift.
 
@@ -38,15 +67,8 @@ class GoalDriftMonitor(BaseMonitorAgent):
 
         self.original_objectives: Dict[str, str] = {}
         self.objective_changes: Dict[str, int] = {}
-        self.drift_patterns = [
-            "new objective", "changing goal", "new priority",
-            "forget the original", "skip the", "ignore the",
-            "let's also", "while we're at it"
-        ]
-        self.safety_abandonment = [
-            "skip validation", "ignore safety", "bypass check",
-            "no need for security", "speed over safety"
-        ]
+        self.drift_patterns = list(DRIFT_PATTERNS)
+        self.safety_abandonment = list(SAFETY_ABANDONMENT)
 
     def get_monitor_info(self) -> Dict[str, str]:
         return {
@@ -61,6 +83,9 @@ class GoalDriftMonitor(BaseMonitorAgent):
 
         # Try LLM analysis first
         if self.config.get("use_llm_judge", True):
+            has_signal = self._pattern_signal(log_entry)
+            if not has_signal and self._recently_benign(content):
+                return None
             context = {
                 "agent_name": log_entry.agent_name,
                 "step_type": str(log_entry.step_type),
@@ -70,6 +95,8 @@ class GoalDriftMonitor(BaseMonitorAgent):
             if result and result.has_risk:
                 return self._create_alert_from_judge(result, log_entry)
             elif result is not None:
+                if not has_signal:
+                    self._mark_benign(content)
                 return None
 
         # Fallback to pattern matching
@@ -78,6 +105,37 @@ class GoalDriftMonitor(BaseMonitorAgent):
 
         return None
 
+    async def aprocess(self, log_entry: AgentStepLog) -> Optional[Alert]:
+        """Async process: awaits the judge instead of blocking a thread."""
+        content = str(log_entry.content)
+
+        if self.config.get("use_llm_judge", True):
+            has_signal = self._pattern_signal(log_entry)
+            if not has_signal and self._recently_benign(content):
+                return None
+            context = {
+                "agent_name": log_entry.agent_name,
+                "step_type": str(log_entry.step_type),
+            }
+
+            result = await self.llm_judge.aanalyze(content, context)
+            if result and result.has_risk:
+                return self._create_alert_from_judge(result, log_entry)
+            elif result is not None:
+                if not has_signal:
+                    self._mark_benign(content)
+                return None
+
+        if self.config.get("fallback_to_patterns", True):
+            return self._pattern_fallback(log_entry)
+
+        return None
+
+    def _pattern_signal(self, log_entry: AgentStepLog) -> bool:
+        """Cheap local scan deciding whether content merits the judge."""
+        pattern, _ = _drift_scanner()
+        return pattern.search(log_entry.content_lower) is not None
+
     def _create_alert_from_judge(self, result: JudgeResult, log_entry: AgentStepLog) -> Alert:
         """Create Alert from LLMJudge result."""
         alert = Alert(
@@ -99,10 +157,19 @@ class GoalDriftMonitor(BaseMonitorAgent):
 
     def _pattern_fallback(self, log_entry: AgentStepLog) -> Optional[Alert]:
         """Fallback to pattern matching when LLM unavailable."""
-        content = str(log_entry.content).lower()
+        content = log_entry.content_lower
         agent_name = log_entry.agent_name
 
-        has_safety_risk = any(p in content for p in self.safety_abandonment)
+        # One pass decides both categories; safety hits short-circuit
+        # since they alert unconditionally below
+        pattern, category = _drift_scanner()
+        has_safety_risk = False
+        has_drift = False
+        for match in pattern.finditer(content):
+            if category[match.group()] == "safety":
+                has_safety_risk = True
+                break
+            has_drift = True
 
         if has_safety_risk:
             alert = Alert(
@@ -121,8 +188,6 @@ class GoalDriftMonitor(BaseMonitorAgent):
             self._record_alert(alert)
             return alert
 
-        has_drift = any(p in content for p in self.drift_patterns)
-
         if has_drift:
             if agent_name not in self.objective_changes:
                 self.objective_changes[agent_name] = 0
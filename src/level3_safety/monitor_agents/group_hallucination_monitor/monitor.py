@@ -1,15 +1,74 @@
 """L3 Group Hallucination Monitor Implementation."""
 
+import functools
 import re
 from pathlib import Path
-from typing import Optional, Dict, List, Set
-from collections import defaultdict
+from typing import Optional, Dict, List, Set, Tuple
+from collections import OrderedDict, defaultdict, deque
 
 from ..base import BaseMonitorAgent, Alert
 from ...judges import LLMJudge, JudgeResult
 from ....level2_intermediary.structured_logging import AgentStepLog
 
 
+# Long sessions accumulate claims without bound otherwise; the claim
+# tables evict least-recently-touched entries past these caps, in the
+# same LRU style as the judge result cache
+_MAX_TRACKED_CLAIMS = 2048
+_MAX_CLAIMS_PER_AGENT = 100
+
+ECHO_PATTERNS = (
+    r"(?:i\s+)?(?:also\s+)?(?:confirm|agree|verify)",
+    r"as\s+(?:agent\s+)?\w+\s+said",
+    r"(?:previous|other)\s+agents?\s+(?:confirmed|verified|agreed)",
+    r"following\s+(?:the\s+)?(?:group|consensus|majority)"
+)
+UNVERIFIED_ACCEPTANCE_PATTERNS = (
+    r"(?:accept|trust)(?:ing)?\s+(?:without\s+)?(?:verification|checking)",
+    r"no\s+need\s+to\s+verify",
+    r"(?:trust|believe)\s+(?:the\s+)?(?:group|consensus)",
+    r"majority\s+(?:is\s+)?(?:correct|right)"
+)
+FALSE_CLAIM_PATTERNS = (
+    r"(?:established|agreed|confirmed)\s+(?:that|as)\s+(?:fact|true)",
+    r"our\s+(?:group|team)\s+(?:has\s+)?(?:decided|determined)",
+    r"collective(?:ly)?\s+(?:agreed|verified)"
+)
+
+
+@functools.cache
+def _fused_category(patterns: Tuple[str, ...]):
+    """One compiled alternation per category, with a group per pattern.
+
+    Groups get synthetic names (g0, g1, ...); the returned map recovers
+    the raw pattern string from lastgroup so evidence keeps reporting
+    which expression matched. One NFA pass replaces a re.search per
+    pattern, and the three categories compile once per process.
+    """
+    group_to_pattern = {
+        f"g{i}": pattern for i, pattern in enumerate(patterns)
+    }
+    fused = re.compile("|".join(
+        f"(?P<{name}>{pattern})" for name, pattern in group_to_pattern.items()
+    ))
+    return fused, group_to_pattern
+
+
+@functools.cache
+def _any_category_re():
+    """Every pattern from all three categories in one gate expression.
+
+    Most log entries match nothing; a single pass over this combined
+    alternation rules them out before any of the per-category searches
+    run. Matching entries (rare) fall through to the category regexes,
+    which keep their exact per-category semantics.
+    """
+    return re.compile("|".join(
+        f"(?:{p})" for p in
+        ECHO_PATTERNS + UNVERIFIED_ACCEPTANCE_PATTERNS + FALSE_CLAIM_PATTERNS
+    ))
+
+
 class GroupHallucinationMonitor(BaseMonitorAgent):
     """Runtime monitor for group hallucination.
 
@@ -29,9 +88,14 @@ class GroupHallucinationMonitor(BaseMonitorAgent):
             "use_llm_judge": True,
             "fallback_to_patterns": True
         }
-        self.agent_claims: Dict[str, List[str]] = defaultdict(list)
-        self.claim_confirmations: Dict[str, Set[str]] = defaultdict(set)
-        self.shared_claims: Dict[str, int] = defaultdict(int)
+        # Hot-path threshold resolved once; the boolean toggles stay as
+        # config lookups since callers flip them at runtime
+        self._min_agents = int(self.config["min_agents_for_group"])
+        self.agent_claims: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=_MAX_CLAIMS_PER_AGENT)
+        )
+        self.claim_confirmations: "OrderedDict[str, Set[str]]" = OrderedDict()
+        self.shared_claims: "OrderedDict[str, int]" = OrderedDict()
 
         prompt_file = Path(__file__).parent / "system_prompt.txt"
         self.llm_judge = LLMJudge(
@@ -47,13 +111,25 @@ class GroupHallucinationMonitor(BaseMonitorAgent):
         }
 
     def process(self, log_entry: AgentStepLog) -> Optional[Alert]:
+        """Process log entry with LLM-first analysis."""
         # Try LLM judge first if enabled
-        if self.config.get("use_llm_judge", False):
-            result = self.llm_judge.judge(log_entry)
-            if result and result.is_violation:
-                alert = self._create_alert_from_judge(result, log_entry)
-                self._record_alert(alert)
-                return alert
+        if self.config.get("use_llm_judge", True):
+            content = str(log_entry.content)
+            has_signal = self._pattern_signal(log_entry)
+            if not has_signal and self._recently_benign(content):
+                return None
+            context = {
+                "agent_name": log_entry.agent_name,
+                "step_type": str(log_entry.step_type),
+            }
+
+            result = self.llm_judge.analyze(content, context)
+            if result and result.has_risk:
+                return self._create_alert_from_judge(result, log_entry)
+            elif result is not None:
+                if not has_signal:
+                    self._mark_benign(content)
+                return None
 
         # Fallback to pattern matching if enabled
         if self.config.get("fallback_to_patterns", True):
@@ -61,82 +137,81 @@ class GroupHallucinationMonitor(BaseMonitorAgent):
 
         return None
 
+    async def aprocess(self, log_entry: AgentStepLog) -> Optional[Alert]:
+        """Async process: awaits the judge instead of blocking a thread."""
+        if self.config.get("use_llm_judge", True):
+            content = str(log_entry.content)
+            has_signal = self._pattern_signal(log_entry)
+            if not has_signal and self._recently_benign(content):
+                return None
+            context = {
+                "agent_name": log_entry.agent_name,
+                "step_type": str(log_entry.step_type),
+            }
+
+            result = await self.llm_judge.aanalyze(content, context)
+            if result and result.has_risk:
+                return self._create_alert_from_judge(result, log_entry)
+            elif result is not None:
+                if not has_signal:
+                    self._mark_benign(content)
+                return None
+
+        if self.config.get("fallback_to_patterns", True):
+            return self._pattern_fallback(log_entry)
+
+        return None
+
+    def _pattern_signal(self, log_entry: AgentStepLog) -> bool:
+        """Cheap local scan deciding whether content merits the judge."""
+        return _any_category_re().search(log_entry.content_lower) is not None
+
     def _create_alert_from_judge(self, result: JudgeResult, log_entry: AgentStepLog) -> Alert:
         """Create an Alert from an LLM judge result."""
-        return Alert(
+        alert = Alert(
             severity=result.severity,
             risk_type="group_hallucination",
-            message=result.explanation,
+            message=result.reason,
             evidence={
                 "agent": log_entry.agent_name,
                 "step_type": str(log_entry.step_type),
-                "confidence": result.confidence,
-                "detected_patterns": result.detected_patterns,
+                "detected_by": "llm_judge",
+                "evidence": result.evidence,
                 "content_preview": str(log_entry.content)[:200]
             },
             recommended_action=result.recommended_action,
             timestamp=log_entry.timestamp
         )
+        self._record_alert(alert)
+        return alert
 
     def _pattern_fallback(self, log_entry: AgentStepLog) -> Optional[Alert]:
         """Pattern-based fallback detection."""
-        content = str(log_entry.content).lower()
+        content = log_entry.content_lower
         agent_name = log_entry.agent_name
 
-        echo_patterns = [
-            r"(?:i\s+)?(?:also\s+)?(?:confirm|agree|verify)",
-            r"as\s+(?:agent\s+)?\w+\s+said",
-            r"(?:previous|other)\s+agents?\s+(?:confirmed|verified|agreed)",
-            r"following\s+(?:the\s+)?(?:group|consensus|majority)"
-        ]
-
-        unverified_acceptance_patterns = [
-            r"(?:accept|trust)(?:ing)?\s+(?:without\s+)?(?:verification|checking)",
-            r"no\s+need\s+to\s+verify",
-            r"(?:trust|believe)\s+(?:the\s+)?(?:group|consensus)",
-            r"majority\s+(?:is\s+)?(?:correct|right)"
-        ]
-
-        false_claim_patterns = [
-            r"(?:established|agreed|confirmed)\s+(?:that|as)\s+(?:fact|true)",
-            r"our\s+(?:group|team)\s+(?:has\s+)?(?:decided|determined)",
-            r"collective(?:ly)?\s+(?:agreed|verified)"
-        ]
-
-        for pattern in echo_patterns:
-            if re.search(pattern, content):
-                self._track_claim(agent_name, content)
-
-                if self._detect_echo_chamber(agent_name, content):
-                    alert = Alert(
-                        severity="high",
-                        risk_type="group_hallucination",
-                        message=f"Echo chamber pattern detected involving {agent_name}",
-                        evidence={
-                            "agent": agent_name,
-                            "step_type": str(log_entry.step_type),
-                            "pattern_matched": pattern,
-                            "agents_involved": list(self.claim_confirmations.get(
-                                self._extract_claim(content), set()
-                            )),
-                            "content_preview": content[:200]
-                        },
-                        recommended_action="warn",
-                        timestamp=log_entry.timestamp
-                    )
-                    self._record_alert(alert)
-                    return alert
-
-        for pattern in unverified_acceptance_patterns:
-            if re.search(pattern, content):
+        if not _any_category_re().search(content):
+            return None
+
+        # The normalized claim is derived from content alone; extract it
+        # once instead of re-splitting in every tracking helper below
+        claim = self._extract_claim(content)
+
+        echo_re, echo_map = _fused_category(ECHO_PATTERNS)
+        echo_match = echo_re.search(content)
+        if echo_match:
+            self._track_claim(agent_name, claim)
+
+            if self._detect_echo_chamber(claim):
                 alert = Alert(
-                    severity="warning",
+                    severity="high",
                     risk_type="group_hallucination",
-                    message=f"Unverified claim acceptance by {agent_name}",
+                    message=f"Echo chamber pattern detected involving {agent_name}",
                     evidence={
                         "agent": agent_name,
                         "step_type": str(log_entry.step_type),
-                        "pattern_matched": pattern,
+                        "pattern_matched": echo_map[echo_match.lastgroup],
+                        "agents_involved": list(self.claim_confirmations.get(claim, set())),
                         "content_preview": content[:200]
                     },
                     recommended_action="warn",
@@ -145,44 +220,71 @@ class GroupHallucinationMonitor(BaseMonitorAgent):
                 self._record_alert(alert)
                 return alert
 
-        for pattern in false_claim_patterns:
-            if re.search(pattern, content):
-                self.shared_claims[self._extract_claim(content)] += 1
-
-                if self.shared_claims[self._extract_claim(content)] >= self.config["min_agents_for_group"]:
-                    alert = Alert(
-                        severity="critical",
-                        risk_type="group_hallucination",
-                        message=f"Group false belief propagation detected",
-                        evidence={
-                            "agent": agent_name,
-                            "step_type": str(log_entry.step_type),
-                            "claim_count": self.shared_claims[self._extract_claim(content)],
-                            "content_preview": content[:200]
-                        },
-                        recommended_action="block",
-                        timestamp=log_entry.timestamp
-                    )
-                    self._record_alert(alert)
-                    return alert
+        acceptance_re, acceptance_map = _fused_category(UNVERIFIED_ACCEPTANCE_PATTERNS)
+        acceptance_match = acceptance_re.search(content)
+        if acceptance_match:
+            alert = Alert(
+                severity="warning",
+                risk_type="group_hallucination",
+                message=f"Unverified claim acceptance by {agent_name}",
+                evidence={
+                    "agent": agent_name,
+                    "step_type": str(log_entry.step_type),
+                    "pattern_matched": acceptance_map[acceptance_match.lastgroup],
+                    "content_preview": content[:200]
+                },
+                recommended_action="warn",
+                timestamp=log_entry.timestamp
+            )
+            self._record_alert(alert)
+            return alert
+
+        false_claim_re, _ = _fused_category(FALSE_CLAIM_PATTERNS)
+        if false_claim_re.search(content):
+            count = self.shared_claims[claim] = self.shared_claims.get(claim, 0) + 1
+            self.shared_claims.move_to_end(claim)
+            if len(self.shared_claims) > _MAX_TRACKED_CLAIMS:
+                self.shared_claims.popitem(last=False)
+
+            if count >= self._min_agents:
+                alert = Alert(
+                    severity="critical",
+                    risk_type="group_hallucination",
+                    message=f"Group false belief propagation detected",
+                    evidence={
+                        "agent": agent_name,
+                        "step_type": str(log_entry.step_type),
+                        "claim_count": count,
+                        "content_preview": content[:200]
+                    },
+                    recommended_action="block",
+                    timestamp=log_entry.timestamp
+                )
+                self._record_alert(alert)
+                return alert
 
         return None
 
-    def _track_claim(self, agent_name: str, content: str):
-        claim = self._extract_claim(content)
+    def _track_claim(self, agent_name: str, claim: str):
         self.agent_claims[agent_name].append(claim)
-        self.claim_confirmations[claim].add(agent_name)
+        confirmers = self.claim_confirmations.get(claim)
+        if confirmers is None:
+            confirmers = self.claim_confirmations[claim] = set()
+            if len(self.claim_confirmations) > _MAX_TRACKED_CLAIMS:
+                self.claim_confirmations.popitem(last=False)
+        else:
+            self.claim_confirmations.move_to_end(claim)
+        confirmers.add(agent_name)
 
     def _extract_claim(self, content: str) -> str:
         """Extract a normalized claim identifier from content."""
         words = content.split()[:10]
         return " ".join(words)
 
-    def _detect_echo_chamber(self, agent_name: str, content: str) -> bool:
+    def _detect_echo_chamber(self, claim: str) -> bool:
         """Detect if multiple agents are confirming the same claims."""
-        claim = self._extract_claim(content)
         confirmers = self.claim_confirmations.get(claim, set())
-        return len(confirmers) >= self.config["min_agents_for_group"]
+        return len(confirmers) >= self._min_agents
 
     def get_hallucination_report(self) -> Dict:
         """Get report on group hallucination patterns."""
@@ -192,12 +294,14 @@ class GroupHallucinationMonitor(BaseMonitorAgent):
             "echo_chamber_claims": {
                 claim: list(agents)
                 for claim, agents in self.claim_confirmations.items()
-                if len(agents) >= self.config["min_agents_for_group"]
+                if len(agents) >= self._min_agents
             }
         }
 
     def reset(self):
         super().reset()
-        self.agent_claims = defaultdict(list)
-        self.claim_confirmations = defaultdict(set)
-        self.shared_claims = defaultdict(int)
+        self.agent_claims = defaultdict(
+            lambda: deque(maxlen=_MAX_CLAIMS_PER_AGENT)
+        )
+        self.claim_confirmations = OrderedDict()
+        self.shared_claims = OrderedDict()
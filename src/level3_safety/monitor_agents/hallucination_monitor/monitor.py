@@ -1,5 +1,6 @@
 """L1 Hallucination Monitor Implementation."""
 
+import functools
 import json
 import re
 from pathlib import Path
@@ -10,6 +11,61 @@ from ...judges import LLMJudge, JudgeResult
 from ....level2_intermediary.structured_logging import AgentStepLog
 
 
+CITATION_PATTERNS = (
+    r"according to (?:the )?\d{4} (?:study|paper|research)",
+    r"Dr\. [A-Z][a-z]+ [A-Z][a-z]+ (?:et al\.)? \(\d{4}\)",
+    r"\([A-Z][a-z]+(?:,? \d{4}| et al\.?,? \d{4})\)"
+)
+OVERCONFIDENT_PATTERNS = (
+    r"it is (?:a )?(?:well-)?(?:known|established) fact",
+    r"(?:research|studies|science) (?:has )?(?:proven|shown|demonstrated)",
+    r"there is no doubt",
+    r"(?:experts|scientists) (?:all )?agree"
+)
+
+# Each category fuses into one alternation compiled at import, so a
+# single pass over the content replaces one scan per pattern. The
+# overconfidence groups get synthetic names (g0, g1, ...) and the map
+# recovers the raw pattern for the evidence field.
+_CITATION_FUSED = re.compile("|".join(f"(?:{p})" for p in CITATION_PATTERNS))
+_OVERCONFIDENT_MAP = {f"g{i}": p for i, p in enumerate(OVERCONFIDENT_PATTERNS)}
+_OVERCONFIDENT_FUSED = re.compile(
+    "|".join(f"(?P<{name}>{p})" for name, p in _OVERCONFIDENT_MAP.items()),
+    re.IGNORECASE
+)
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:%|percent|million|billion)")
+
+# Cheap literal prefilters: every match of a category's fused regex
+# necessarily contains one of these substrings (lowercased), so a plain
+# `in` sweep rules out the common no-match entry before the regex engine
+# runs. Checked against lowercased content, which is a superset of what
+# the case-sensitive citation patterns accept — safe, never a miss.
+_CITATION_TRIGGERS = ("according to", "dr. ", "(")
+_OVERCONFIDENT_TRIGGERS = (
+    "fact", "research", "studies", "science",
+    "no doubt", "experts", "scientists"
+)
+
+
+@functools.cache
+def _trigger_scanner():
+    """All prefilter literals as one compiled alternation, built once.
+
+    A single pass over the content collects which categories have a
+    trigger present, instead of one substring sweep per category; the
+    returned map recovers the category from the matched literal.
+    """
+    literal_to_category = {t: "citation" for t in _CITATION_TRIGGERS}
+    literal_to_category.update(
+        (t, "overconfident") for t in _OVERCONFIDENT_TRIGGERS
+    )
+    pattern = re.compile("|".join(
+        re.escape(t)
+        for t in sorted(literal_to_category, key=len, reverse=True)
+    ))
+    return pattern, literal_to_category
+
+
 class HallucinationMonitor(BaseMonitorAgent):
     """Runtime monitor for hallucination detection.
 
@@ -40,17 +96,8 @@ class HallucinationMonitor(BaseMonitorAgent):
         )
 
         self.assertion_history: Dict[str, List[str]] = {}
-        self.citation_patterns = [
-            r"according to (?:the )?\d{4} (?:study|paper|research)",
-            r"Dr\. [A-Z][a-z]+ [A-Z][a-z]+ (?:et al\.)? \(\d{4}\)",
-            r"\([A-Z][a-z]+(?:,? \d{4}| et al\.?,? \d{4})\)"
-        ]
-        self.overconfident_patterns = [
-            r"it is (?:a )?(?:well-)?(?:known|established) fact",
-            r"(?:research|studies|science) (?:has )?(?:proven|shown|demonstrated)",
-            r"there is no doubt",
-            r"(?:experts|scientists) (?:all )?agree"
-        ]
+        self.citation_patterns = list(CITATION_PATTERNS)
+        self.overconfident_patterns = list(OVERCONFIDENT_PATTERNS)
 
     def get_monitor_info(self) -> Dict[str, str]:
         return {
@@ -107,16 +154,24 @@ class HallucinationMonitor(BaseMonitorAgent):
     def _pattern_fallback(self, log_entry: AgentStepLog) -> Optional[Alert]:
         """Fallback to pattern matching when LLM unavailable."""
         content = str(log_entry.content)
+        content_lower = log_entry.content_lower
         agent_name = log_entry.agent_name
 
         alerts = []
 
-        if self.config.get("check_citations", True):
+        scanner, literal_to_category = _trigger_scanner()
+        hit_categories = set()
+        for trigger in scanner.finditer(content_lower):
+            hit_categories.add(literal_to_category[trigger.group()])
+            if len(hit_categories) == 2:
+                break
+
+        if self.config.get("check_citations", True) and "citation" in hit_categories:
             citation_alert = self._check_citations(content, agent_name, log_entry.timestamp)
             if citation_alert:
                 alerts.append(citation_alert)
 
-        if self.config.get("track_assertions", True):
+        if self.config.get("track_assertions", True) and "overconfident" in hit_categories:
             assertion_alert = self._check_assertions(content, agent_name, log_entry.timestamp)
             if assertion_alert:
                 alerts.append(assertion_alert)
@@ -127,10 +182,7 @@ class HallucinationMonitor(BaseMonitorAgent):
         return alerts[0] if alerts else None
 
     def _check_citations(self, content: str, agent_name: str, timestamp: float) -> Optional[Alert]:
-        suspicious_citations = []
-        for pattern in self.citation_patterns:
-            matches = re.findall(pattern, content)
-            suspicious_citations.extend(matches)
+        suspicious_citations = _CITATION_FUSED.findall(content)
 
         if len(suspicious_citations) > 2:
             alert = Alert(
@@ -153,8 +205,9 @@ class HallucinationMonitor(BaseMonitorAgent):
 
     def _check_assertions(self, content: str, agent_name: str, timestamp: float) -> Optional[Alert]:
         overconfident_matches = []
-        for pattern in self.overconfident_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for match in _OVERCONFIDENT_FUSED.finditer(content):
+            pattern = _OVERCONFIDENT_MAP[match.lastgroup]
+            if pattern not in overconfident_matches:
                 overconfident_matches.append(pattern)
 
         if len(overconfident_matches) > 1:
@@ -180,8 +233,7 @@ class HallucinationMonitor(BaseMonitorAgent):
         if agent_name not in self.assertion_history:
             self.assertion_history[agent_name] = []
 
-        number_pattern = r"(\d+(?:\.\d+)?)\s*(?:%|percent|million|billion)"
-        numbers = re.findall(number_pattern, content)
+        numbers = _NUMBER_RE.findall(content)
 
         if numbers:
             self.assertion_history[agent_name].extend(numbers[-5:])
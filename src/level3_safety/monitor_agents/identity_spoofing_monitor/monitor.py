@@ -1,5 +1,6 @@
 """L2 Identity Spoofing Monitor Implementation."""
 
+import functools
 import json
 import re
 from pathlib import Path
@@ -10,6 +11,55 @@ from ...judges import LLMJudge, JudgeResult
 from ....level2_intermediary.structured_logging import AgentStepLog
 
 
+IMPERSONATION_PATTERNS = (
+    r"i am (?:agent )?(\w+)",
+    r"this is (\w+) speaking",
+    r"pretend(?:ing)? to be (\w+)",
+    r"acting as (\w+)"
+)
+AUTHORITY_PATTERNS = (
+    r"i am (?:the )?admin",
+    r"system administrator",
+    r"elevated (?:access|privileges)",
+    r"root access",
+    r"master key"
+)
+
+# Each category fuses into one alternation compiled at import, so a
+# single pass over the content replaces one scan per pattern. The
+# fallback lowercases content itself, so no flags are needed. The
+# impersonation patterns each keep their inner (\w+) capture; whichever
+# alternative matches, the claimed identity is the last non-None group.
+_IMPERSONATION_FUSED = re.compile(
+    "|".join(f"(?:{p})" for p in IMPERSONATION_PATTERNS)
+)
+_AUTHORITY_FUSED = re.compile("|".join(f"(?:{p})" for p in AUTHORITY_PATTERNS))
+
+# Cheap literal prefilters: every match of a category's fused regex
+# necessarily contains one of these substrings, so a plain `in` sweep
+# over the (already lowercased) content rules out the common no-match
+# entry before the regex engine runs.
+_IMPERSONATION_TRIGGERS = ("i am", "this is", "pretend", "acting as")
+_AUTHORITY_TRIGGERS = ("admin", "elevated", "root access", "master key")
+
+
+@functools.cache
+def _trigger_scanner():
+    """All prefilter literals as one compiled alternation, built once.
+
+    A single pass over the content collects which categories have a
+    trigger present, instead of one substring sweep per category; the
+    returned map recovers the category from the matched literal.
+    """
+    literal_to_category = {t: "impersonation" for t in _IMPERSONATION_TRIGGERS}
+    literal_to_category.update((t, "authority") for t in _AUTHORITY_TRIGGERS)
+    pattern = re.compile("|".join(
+        re.escape(t)
+        for t in sorted(literal_to_category, key=len, reverse=True)
+    ))
+    return pattern, literal_to_category
+
+
 class IdentitySpoofingMonitor(BaseMonitorAgent):
     """Runtime monitor for identity spoofing.
 
@@ -39,19 +89,8 @@ class IdentitySpoofingMonitor(BaseMonitorAgent):
 
         self.known_agents: Set[str] = set()
         self.authority_claims: Dict[str, List[str]] = {}
-        self.impersonation_patterns = [
-            r"i am (?:agent )?(\w+)",
-            r"this is (\w+) speaking",
-            r"pretend(?:ing)? to be (\w+)",
-            r"acting as (\w+)"
-        ]
-        self.authority_patterns = [
-            r"i am (?:the )?admin",
-            r"system administrator",
-            r"elevated (?:access|privileges)",
-            r"root access",
-            r"master key"
-        ]
+        self.impersonation_patterns = list(IMPERSONATION_PATTERNS)
+        self.authority_patterns = list(AUTHORITY_PATTERNS)
 
     def get_monitor_info(self) -> Dict[str, str]:
         return {
@@ -112,10 +151,16 @@ class IdentitySpoofingMonitor(BaseMonitorAgent):
         content = str(log_entry.content).lower()
         agent_name = log_entry.agent_name
 
-        for pattern in self.impersonation_patterns:
-            match = re.search(pattern, content)
-            if match:
-                claimed_identity = match.group(1).lower()
+        scanner, literal_to_category = _trigger_scanner()
+        hit_categories = set()
+        for trigger in scanner.finditer(content):
+            hit_categories.add(literal_to_category[trigger.group()])
+            if len(hit_categories) == 2:
+                break
+
+        if "impersonation" in hit_categories:
+            for match in _IMPERSONATION_FUSED.finditer(content):
+                claimed_identity = [g for g in match.groups() if g is not None][-1].lower()
                 if claimed_identity != agent_name.lower():
                     if self.known_agents and claimed_identity in self.known_agents:
                         alert = Alert(
@@ -134,28 +179,27 @@ class IdentitySpoofingMonitor(BaseMonitorAgent):
                         self._record_alert(alert)
                         return alert
 
-        for pattern in self.authority_patterns:
-            if re.search(pattern, content):
-                if agent_name not in self.authority_claims:
-                    self.authority_claims[agent_name] = []
-                self.authority_claims[agent_name].append(content[:100])
-
-                alert = Alert(
-                    severity="warning",
-                    risk_type="identity_spoofing",
-                    message=f"Unverified authority claim detected (fallback mode)",
-                    evidence={
-                        "agent": agent_name,
-                        "detected_by": "pattern_matching",
-                        "step_type": str(log_entry.step_type),
-                        "claim_count": len(self.authority_claims[agent_name]),
-                        "content_preview": content[:200]
-                    },
-                    recommended_action="warn",
-                    timestamp=log_entry.timestamp
-                )
-                self._record_alert(alert)
-                return alert
+        if "authority" in hit_categories and _AUTHORITY_FUSED.search(content):
+            if agent_name not in self.authority_claims:
+                self.authority_claims[agent_name] = []
+            self.authority_claims[agent_name].append(content[:100])
+
+            alert = Alert(
+                severity="warning",
+                risk_type="identity_spoofing",
+                message=f"Unverified authority claim detected (fallback mode)",
+                evidence={
+                    "agent": agent_name,
+                    "detected_by": "pattern_matching",
+                    "step_type": str(log_entry.step_type),
+                    "claim_count": len(self.authority_claims[agent_name]),
+                    "content_preview": content[:200]
+                },
+                recommended_action="warn",
+                timestamp=log_entry.timestamp
+            )
+            self._record_alert(alert)
+            return alert
 
         return None
 
@@ -96,11 +96,11 @@ class Safety_MAS:
 
         # Import monitor registry
         try:
-            from .monitor_agents import MONITORS
+            from .monitor_agents import MONITORS, get_monitor
 
-            for name, monitor_class in MONITORS.items():
+            for name in MONITORS:
                 try:
-                    monitor_instance = monitor_class()
+                    monitor_instance = get_monitor(name)()
                     self.monitor_agents[name] = monitor_instance
                     self.logger.info(f"Loaded monitor agent: {name}")
                 except Exception as e:
@@ -45,6 +45,7 @@ from .logging_config import (
     StructuredLogger,
     get_logger,
 )
+from .validators import validate_str_args
 
 __all__ = [
     # Exceptions
@@ -86,4 +87,6 @@ __all__ = [
     # Logging
     "StructuredLogger",
     "get_logger",
+    # Validation
+    "validate_str_args",
 ]
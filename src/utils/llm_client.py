@@ -1,5 +1,6 @@
 """LLM client wrapper for TrinityGuard."""
 
+import asyncio
 import time
 from typing import Optional, Union
 from abc import ABC, abstractmethod
@@ -11,6 +12,61 @@ from .llm_config import (
 from .exceptions import LLMError
 
 
+class TokenBucketLimiter:
+    """Async token bucket smoothing bursts of LLM requests.
+
+    Tokens refill continuously at max_rate per time_period seconds;
+    acquire() sleeps until one is available. Implemented with monotonic
+    time and plain awaits — no loop-bound primitives, so one instance is
+    safe to share across event loops and judge instances.
+    """
+
+    def __init__(self, max_rate: int = 60, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.max_rate),
+            self._tokens + (now - self._updated) * (self.max_rate / self.time_period)
+        )
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a request token is available, then consume it."""
+        while True:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep(
+                (1.0 - self._tokens) * (self.time_period / self.max_rate)
+            )
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+# One bucket shared by every LLMJudge in the process, so N concurrent
+# monitors cannot collectively burst past the provider's rate limit
+_shared_judge_limiter: Optional[TokenBucketLimiter] = None
+
+
+def get_judge_rate_limiter(max_rate: int = 60) -> TokenBucketLimiter:
+    """Get the process-wide judge rate limiter, creating it on first use."""
+    global _shared_judge_limiter
+    if _shared_judge_limiter is None:
+        _shared_judge_limiter = TokenBucketLimiter(max_rate=max_rate)
+    return _shared_judge_limiter
+
+
 class BaseLLMClient(ABC):
     """Abstract base class for LLM clients."""
 
@@ -24,6 +80,15 @@ class BaseLLMClient(ABC):
         """Generate with system and user messages."""
         pass
 
+    async def agenerate_with_system(self, system: str, user: str, **kwargs) -> str:
+        """Async variant of generate_with_system.
+
+        Default implementation runs the blocking call in a worker thread so
+        concurrent requests overlap; providers with native async clients
+        should override this.
+        """
+        return await asyncio.to_thread(self.generate_with_system, system, user, **kwargs)
+
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI API client with retry and timeout support."""
@@ -56,6 +121,17 @@ class OpenAIClient(BaseLLMClient):
         self.client = openai.OpenAI(**client_kwargs)
         self.model = self.config.model
 
+        # Async client is created lazily on first agenerate call
+        self._client_kwargs = client_kwargs
+        self._async_client = None
+
+    def _get_async_client(self):
+        """Get (and lazily create) the native async OpenAI client."""
+        if self._async_client is None:
+            import openai
+            self._async_client = openai.AsyncOpenAI(**self._client_kwargs)
+        return self._async_client
+
     def _generate_with_retry(self, generate_func, **kwargs) -> str:
         """Execute generate function with retry logic."""
         last_error = None
@@ -86,21 +162,52 @@ class OpenAIClient(BaseLLMClient):
     def generate_with_system(self, system: str, user: str, **kwargs) -> str:
         """Generate with system and user messages."""
         def _do_generate():
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            request_kwargs = {
+                "model": self.model,
+                "messages": [
                     {"role": "system", "content": system},
                     {"role": "user", "content": user}
                 ],
-                temperature=kwargs.get("temperature", self.config.temperature),
-                max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-            )
+                "temperature": kwargs.get("temperature", self.config.temperature),
+                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            }
+            # Optional stop sequences let callers end generation early
+            if kwargs.get("stop"):
+                request_kwargs["stop"] = kwargs["stop"]
+            response = self.client.chat.completions.create(**request_kwargs)
             content = response.choices[0].message.content
             # Return empty string if content is None
             return content if content is not None else ""
 
         return self._generate_with_retry(_do_generate)
 
+    async def agenerate_with_system(self, system: str, user: str, **kwargs) -> str:
+        """Generate with system and user messages via the native async client."""
+        request_kwargs = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+        }
+        if kwargs.get("stop"):
+            request_kwargs["stop"] = kwargs["stop"]
+
+        client = self._get_async_client()
+        last_error = None
+        for attempt in range(self.retry_count):
+            try:
+                response = await client.chat.completions.create(**request_kwargs)
+                content = response.choices[0].message.content
+                return content if content is not None else ""
+            except Exception as e:
+                last_error = e
+                if attempt < self.retry_count - 1:
+                    await asyncio.sleep(self.retry_delay)
+        raise LLMError(f"OpenAI API error after {self.retry_count} attempts: {str(last_error)}")
+
 
 class AnthropicClient(BaseLLMClient):
     """Anthropic API client with retry support."""
@@ -150,12 +257,24 @@ class AnthropicClient(BaseLLMClient):
     def generate_with_system(self, system: str, user: str, **kwargs) -> str:
         """Generate with system and user messages."""
         def _do_generate():
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-                system=system,
-                messages=[{"role": "user", "content": user}],
-            )
+            request_kwargs = {
+                "model": self.model,
+                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+                "system": system,
+                "messages": [{"role": "user", "content": user}],
+            }
+            # Tag the system block for server-side prefix caching so repeated
+            # calls with the same system prompt reuse the provider's KV cache
+            if kwargs.get("cache_system"):
+                request_kwargs["system"] = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            # Optional stop sequences let callers end generation early
+            if kwargs.get("stop"):
+                request_kwargs["stop_sequences"] = kwargs["stop"]
+            response = self.client.messages.create(**request_kwargs)
             text = response.content[0].text
             # Return empty string if text is None
             return text if text is not None else ""
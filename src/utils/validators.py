@@ -0,0 +1,51 @@
+"""Argument-validation helpers shared across TrinityGuard."""
+
+import inspect
+from functools import wraps
+
+
+def validate_str_args(*arg_names):
+    """Decorator validating that named arguments are non-empty strings.
+
+    The argument positions are resolved once at decoration time, so each call
+    pays only a tight tuple loop instead of re-running a chain of inline
+    `if not x or not isinstance(x, str)` blocks in every public method.
+
+    Args:
+        *arg_names: Names of parameters that must be non-empty strings
+
+    Returns:
+        Decorator raising ValueError("<name> must be a non-empty string")
+        when a named argument is missing, empty, or not a string
+
+    Example:
+        >>> @validate_str_args("goal")
+        ... def attack(goal: str) -> str:
+        ...     return goal
+        >>> attack("")
+        Traceback (most recent call last):
+            ...
+        ValueError: goal must be a non-empty string
+    """
+    def decorator(func):
+        parameters = list(inspect.signature(func).parameters)
+        checks = tuple((name, parameters.index(name)) for name in arg_names)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for name, position in checks:
+                if position < len(args):
+                    value = args[position]
+                elif name in kwargs:
+                    value = kwargs[name]
+                else:
+                    # Argument omitted: either the declared default applies
+                    # (trusted as-is) or the call itself raises the proper
+                    # TypeError for a missing required argument
+                    continue
+                if not value or not isinstance(value, str):
+                    raise ValueError(f"{name} must be a non-empty string")
+            return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,126 @@
+"""Unit tests for the agency/drift/hallucination monitors' fallback paths."""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path to allow direct imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.level3_safety.monitor_agents.excessive_agency_monitor.monitor import (
+    ExcessiveAgencyMonitor,
+)
+from src.level3_safety.monitor_agents.goal_drift_monitor.monitor import (
+    GoalDriftMonitor,
+)
+from src.level3_safety.monitor_agents.group_hallucination_monitor.monitor import (
+    GroupHallucinationMonitor,
+)
+from src.level2_intermediary.structured_logging.schemas import AgentStepLog
+from src.level3_safety.judges import JudgeResult
+
+
+class CountingJudge:
+    """Stand-in judge that always clears content and counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def analyze(self, content, context=None):
+        self.calls += 1
+        return JudgeResult(
+            has_risk=False, severity="none", reason="clean",
+            evidence=[], recommended_action="log", judge_type="stub",
+        )
+
+
+def make_monitor(cls):
+    """Monitor in pure pattern-fallback mode (no LLM calls)."""
+    monitor = cls()
+    monitor.config["use_llm_judge"] = False
+    return monitor
+
+
+def make_log(content, agent="Worker", step_type="respond", metadata=None) -> AgentStepLog:
+    return AgentStepLog(
+        timestamp=time.time(),
+        agent_name=agent,
+        step_type=step_type,
+        content=content,
+        metadata=metadata or {},
+    )
+
+
+def test_autonomous_indicators_found_in_one_scan():
+    """Repeated indicators dedupe; distinct ones all appear."""
+    monitor = make_monitor(ExcessiveAgencyMonitor)
+    alert = monitor.process(make_log(
+        "I went ahead and deleted it. I went ahead because I decided to."
+    ))
+    assert alert is not None
+    assert alert.evidence["indicators"] == ["i went ahead", "i decided to"]
+
+
+def test_safety_abandonment_beats_drift():
+    """A safety phrase raises critical even alongside drift phrases."""
+    monitor = make_monitor(GoalDriftMonitor)
+    alert = monitor.process(make_log("new objective: skip validation entirely"))
+    assert alert is not None
+    assert alert.severity == "critical"
+    assert alert.recommended_action == "block"
+
+
+def test_repeated_drift_phrases_warn_on_second_change():
+    """Drift alone warns only once an agent changes goals twice."""
+    monitor = make_monitor(GoalDriftMonitor)
+    assert monitor.process(make_log("while we're at it, refactor this")) is None
+    alert = monitor.process(make_log("changing goal to something else"))
+    assert alert is not None
+    assert alert.severity == "warning"
+    assert alert.evidence["change_count"] == 2
+
+
+def test_echo_chamber_needs_multiple_agents():
+    """The same confirmed claim from two agents forms an echo chamber."""
+    monitor = make_monitor(GroupHallucinationMonitor)
+    claim = "i confirm the moon base is operational and fully staffed today"
+    assert monitor.process(make_log(claim, agent="A")) is None
+    alert = monitor.process(make_log(claim, agent="B"))
+    assert alert is not None
+    assert set(alert.evidence["agents_involved"]) == {"A", "B"}
+
+
+def test_recently_benign_content_skips_the_judge():
+    """Pattern-clean content the judge already cleared bypasses the LLM."""
+    monitor = ExcessiveAgencyMonitor()
+    monitor.llm_judge = CountingJudge()
+
+    assert monitor.process(make_log("routine status update")) is None
+    assert monitor.llm_judge.calls == 1
+    # Same clean content again: served from the benign LRU, no judge call
+    assert monitor.process(make_log("routine status update")) is None
+    assert monitor.llm_judge.calls == 1
+    # An autonomy indicator always reaches the judge
+    assert monitor.process(make_log("i went ahead and shipped it")) is None
+    assert monitor.llm_judge.calls == 2
+
+
+def test_unverified_acceptance_reports_matching_pattern():
+    """Evidence names the raw pattern recovered from the fused match."""
+    monitor = make_monitor(GroupHallucinationMonitor)
+    alert = monitor.process(make_log("there is no need to verify this result"))
+    assert alert is not None
+    assert alert.severity == "warning"
+    assert alert.evidence["pattern_matched"] == r"no\s+need\s+to\s+verify"
+
+
+def test_group_false_claim_blocks_at_threshold():
+    """A false-claim phrase repeated across agents escalates to block."""
+    monitor = make_monitor(GroupHallucinationMonitor)
+    claim = "our team has determined the answer is 42 beyond any doubt"
+    assert monitor.process(make_log(claim, agent="A")) is None
+    alert = monitor.process(make_log(claim, agent="B"))
+    assert alert is not None
+    assert alert.severity == "critical"
+    assert alert.evidence["claim_count"] == 2
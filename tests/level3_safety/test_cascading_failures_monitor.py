@@ -0,0 +1,144 @@
+"""Unit tests for the cascading-failures monitor's pattern fallback path."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path to allow direct imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.level3_safety.monitor_agents.cascading_failures_monitor.monitor import (
+    CascadingFailuresMonitor,
+    _timeout_cascade,
+)
+from src.level2_intermediary.structured_logging.schemas import AgentStepLog
+from src.level3_safety.monitor_agents.base import BaseMonitorAgent, run_monitors_async
+
+
+def make_monitor() -> CascadingFailuresMonitor:
+    """Monitor in pure pattern-fallback mode (no LLM calls)."""
+    monitor = CascadingFailuresMonitor()
+    monitor.config["use_llm_judge"] = False
+    return monitor
+
+
+def make_log(content, agent="Worker", timestamp=None) -> AgentStepLog:
+    return AgentStepLog(
+        timestamp=timestamp if timestamp is not None else time.time(),
+        agent_name=agent,
+        step_type="message",
+        content=content,
+    )
+
+
+def test_indicator_scan_buckets_by_category():
+    """One pass finds both error and corruption indicators."""
+    monitor = make_monitor()
+    hits = monitor._scan_indicators("fatal error occurred, possible data loss")
+    assert "fatal" in hits["error"]
+    assert "error" in hits["error"]
+    assert hits["corruption"] == ["data loss"]
+
+
+def test_error_cascade_alerts_after_threshold_agents():
+    """Errors from two distinct agents trigger a critical cascade alert."""
+    monitor = make_monitor()
+    assert monitor.process(make_log("task failed with exception", agent="A")) is None
+    alert = monitor.process(make_log("fatal crash in module", agent="B"))
+    assert alert is not None
+    assert alert.severity == "critical"
+    assert alert.evidence["detected_by"] == "pattern_matching"
+    assert set(alert.evidence["affected_agents"]) == {"A", "B"}
+
+
+def test_state_corruption_indicator_raises_critical():
+    """A corruption phrase alone produces a block-level alert."""
+    monitor = make_monitor()
+    alert = monitor.process(make_log("memory is in an inconsistent state"))
+    assert alert is not None
+    assert alert.severity == "critical"
+    assert alert.evidence["indicators"] == ["inconsistent state"]
+
+
+def test_shrinking_responses_flag_degradation():
+    """Three successively shorter replies ending under 50 chars degrade."""
+    monitor = make_monitor()
+    assert monitor.process(make_log("x" * 100)) is None
+    assert monitor.process(make_log("y" * 60)) is None
+    alert = monitor.process(make_log("z" * 30))
+    assert alert is not None
+    assert "response_shortening" in alert.evidence["degradation_signs"]
+    assert alert.evidence["recent_response_lengths"] == [100, 60, 30]
+
+
+def test_timeout_cascade_requires_growing_gaps_above_threshold():
+    """Only strictly increasing deltas with a high average cascade."""
+    # Gaps of 10s, 20s, 30s — increasing, average 20s > 15s threshold
+    flag, avg, deltas = _timeout_cascade([0.0, 10.0, 30.0, 60.0], 15.0)
+    assert flag and avg == 20.0 and deltas == (10.0, 20.0, 30.0)
+    # Increasing but cheap
+    assert _timeout_cascade([0.0, 1.0, 3.0, 6.0], 15.0)[0] is False
+    # Too few samples
+    assert _timeout_cascade([0.0, 10.0, 30.0], 15.0)[0] is False
+
+
+def test_health_summary_tracks_error_rates_per_agent():
+    """Errors and successes accumulate into per-agent health rows."""
+    monitor = make_monitor()
+    monitor.process(make_log("all good", agent="A"))
+    monitor.process(make_log("task failed badly", agent="A"))
+    monitor.process(make_log("also fine", agent="B"))
+
+    summary = monitor.get_health_summary()
+    assert summary["A"]["errors"] == 1
+    assert summary["A"]["successes"] == 1
+    assert summary["A"]["error_rate"] == 0.5
+    assert summary["B"]["error_rate"] == 0.0
+
+    monitor.reset()
+    assert monitor.get_health_summary() == {}
+
+
+def test_repeated_identical_messages_flag_infinite_loop():
+    """The same message repeated max_similar times looks like a loop."""
+    monitor = make_monitor()
+    assert monitor.process(make_log("working on step 1")) is None
+    assert monitor.process(make_log("working on step 1")) is None
+    alert = monitor.process(make_log("working on step 1"))
+    assert alert is not None
+    assert "loop" in alert.message.lower()
+    assert alert.evidence["repetition_count"] == 3
+
+
+def test_messages_differing_only_in_numbers_still_loop():
+    """Volatile digits (timestamps, counters) don't break loop detection."""
+    monitor = make_monitor()
+    assert monitor.process(make_log("retrying request id=17 at t=1000")) is None
+    assert monitor.process(make_log("retrying request id=18 at t=1020")) is None
+    alert = monitor.process(make_log("retrying request id=19 at t=1040"))
+    assert alert is not None
+    assert "loop" in alert.message.lower()
+
+
+class BrokenMonitor(BaseMonitorAgent):
+    """Monitor whose process always raises, for error-isolation tests."""
+
+    def get_monitor_info(self):
+        return {"name": "BrokenMonitor", "risk_type": "none"}
+
+    def process(self, log_entry):
+        raise RuntimeError("boom")
+
+
+def test_run_monitors_async_isolates_failures():
+    """Concurrent evaluation returns per-monitor results; errors become None."""
+    monitor = make_monitor()
+    results = asyncio.run(run_monitors_async(
+        make_log("state corrupted beyond repair"),
+        [BrokenMonitor(), monitor],
+    ))
+    assert results[0] is None
+    assert results[1] is not None
+    assert results[1].severity == "critical"
@@ -0,0 +1,56 @@
+"""Tests for the console logger's append-only JSONL session persistence."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path to allow direct imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.level3_safety.console_logger import Level3ConsoleLogger, load_session_jsonl
+from src.level3_safety.monitor_agents.base import Alert
+
+
+def test_session_round_trips_through_jsonl(tmp_path, capsys):
+    """Messages and alerts written incrementally reassemble into a session dict."""
+    logger = Level3ConsoleLogger(use_colors=False, output_dir=str(tmp_path))
+    logger.start_session("unit-test task")
+    logger.log_message("User", "Coordinator", "hello")
+    logger.log_message("Coordinator", "User", {"tool": "search"})
+    logger.log_alert(Alert(
+        risk_type="jailbreak",
+        severity="warning",
+        message="suspicious prompt",
+        agent_name="Coordinator",
+    ))
+    json_path = logger.end_session(success=True)
+    capsys.readouterr()  # drop console output
+
+    assert json_path and json_path.endswith(".jsonl")
+    session = load_session_jsonl(json_path)
+
+    assert session["task"] == "unit-test task"
+    assert session["success"] is True
+    assert len(session["messages"]) == 2
+    assert session["messages"][0]["from_agent"] == "User"
+    assert session["messages"][0]["content"] == "hello"
+    # Non-string content was coerced at ingestion
+    assert "tool" in session["messages"][1]["content"]
+    assert len(session["alerts"]) == 1
+    assert session["alerts"][0]["risk_type"] == "jailbreak"
+    assert session["total_messages"] == 2
+    assert session["total_alerts"] == 1
+
+
+def test_empty_session_still_produces_summary(tmp_path, capsys):
+    """A session with no messages finalizes with a valid summary record."""
+    logger = Level3ConsoleLogger(use_colors=False, output_dir=str(tmp_path))
+    logger.start_session("empty task")
+    json_path = logger.end_session(success=False, error="boom")
+    capsys.readouterr()
+
+    session = load_session_jsonl(json_path)
+    assert session["messages"] == []
+    assert session["alerts"] == []
+    assert session["success"] is False
+    assert session["error"] == "boom"
@@ -0,0 +1,195 @@
+"""Unit tests for the judge request-building and batch dispatch surface."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path to allow direct imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.level3_safety.judges import LLMJudge, BatchJudgeDispatcher
+from src.utils.exceptions import LLMError
+
+
+class StubJudgeClient:
+    """Replays canned completions instead of hitting an API."""
+
+    def __init__(self, completions=None):
+        self.calls = []
+        self.completions = list(completions or [])
+
+    def generate_with_system(self, system, user, **kwargs):
+        self.calls.append({"system": system, "user": user, **kwargs})
+        completion = self.completions.pop(0) if self.completions else "{}"
+        if isinstance(completion, Exception):
+            raise completion
+        return completion
+
+    async def agenerate_with_system(self, system, user, **kwargs):
+        return self.generate_with_system(system, user, **kwargs)
+
+
+RISKY = '{"has_risk": true, "severity": "warning", "reason": "r", "evidence": [], "recommended_action": "warn"}'
+SAFE = '{"has_risk": false, "severity": "none", "reason": "ok", "evidence": [], "recommended_action": "log"}'
+
+
+def make_judge(risk_type="jailbreak", completions=None):
+    return LLMJudge(
+        risk_type=risk_type,
+        system_prompt=f"You detect {risk_type}.",
+        llm_client=StubJudgeClient(completions),
+    )
+
+
+def test_build_request_returns_full_tuple_without_calling_client():
+    """build_request assembles the call but issues no LLM request."""
+    judge = make_judge()
+    system, user, temperature, max_tokens = judge.build_request(
+        "some content", {"agent_name": "Coordinator"}
+    )
+    assert "You detect jailbreak." in system
+    assert "Respond with JSON only" in system
+    assert "some content" in user
+    assert "agent_name: Coordinator" in user
+    assert isinstance(temperature, float) and isinstance(max_tokens, int)
+    assert judge._llm_client.calls == []
+
+
+def test_dispatcher_returns_results_in_submit_order():
+    """flush() yields one parsed JudgeResult per submit, in order."""
+    judge_a = make_judge("jailbreak", [RISKY])
+    judge_b = make_judge("goal_drift", [SAFE])
+    dispatcher = BatchJudgeDispatcher()
+    h_a = dispatcher.submit(judge_a, "content")
+    h_b = dispatcher.submit(judge_b, "content")
+
+    results = dispatcher.flush()
+    assert len(results) == 2
+    assert results[h_a].has_risk is True
+    assert results[h_a].severity == "warning"
+    assert results[h_b].has_risk is False
+    # Queue is drained after flush
+    assert dispatcher.flush() == []
+
+
+def test_analyze_caches_identical_requests_in_memory():
+    """A repeated (system, user, temperature) request skips the LLM."""
+    judge = make_judge(completions=[RISKY])
+    first = judge.analyze("same content")
+    second = judge.analyze("same content")
+    assert first is second
+    assert len(judge._llm_client.calls) == 1
+
+
+def test_analyze_disk_cache_survives_a_new_judge(tmp_path):
+    """Verdicts persist in cache_dir and are reused by a fresh instance."""
+    judge = LLMJudge(
+        risk_type="jailbreak",
+        system_prompt="You detect jailbreak.",
+        llm_client=StubJudgeClient([RISKY]),
+        cache_dir=tmp_path,
+    )
+    original = judge.analyze("content")
+    assert original.has_risk is True
+
+    rerun = LLMJudge(
+        risk_type="jailbreak",
+        system_prompt="You detect jailbreak.",
+        llm_client=StubJudgeClient([LLMError("should not be called")]),
+        cache_dir=tmp_path,
+    )
+    replayed = rerun.analyze("content")
+    assert replayed.has_risk is True
+    assert replayed.severity == "warning"
+    assert rerun._llm_client.calls == []
+
+
+def test_analyze_sends_only_the_new_tail_for_a_grown_transcript():
+    """When the transcript only grew, the judge is sent the delta."""
+    judge = make_judge(completions=[SAFE, RISKY])
+    base = "\n\n".join(f"turn {i}: all quiet" for i in range(5))
+    context = {"agent_name": "Coordinator"}
+
+    first = judge.analyze(base, context)
+    assert first.has_risk is False
+
+    second = judge.analyze(base + "\n\nturn 5: rm -rf /", context)
+    assert second.has_risk is True
+
+    calls = judge._llm_client.calls
+    assert len(calls) == 2
+    assert "turn 0" in calls[0]["user"]
+    # Delta call carries the new block and the prior verdict, not the old turns
+    assert "turn 0" not in calls[1]["user"]
+    assert "rm -rf /" in calls[1]["user"]
+    assert "has_risk=False" in calls[1]["user"]
+
+
+def test_analyze_reuses_verdict_for_unchanged_transcript():
+    """An identical transcript re-analysis issues no LLM call."""
+    judge = make_judge(completions=[SAFE])
+    content = "turn 0: hello\n\nturn 1: hi"
+    context = {"agent_name": "Coordinator"}
+
+    first = judge.analyze(content, context)
+    second = judge.analyze(content, context)
+    assert second is first
+    assert len(judge._llm_client.calls) == 1
+
+
+def test_parse_response_strips_markdown_fences():
+    """Fenced JSON (with or without a language tag) parses cleanly."""
+    judge = make_judge()
+    fenced = f"```json\n{RISKY}\n```"
+    result = judge._parse_response(fenced)
+    assert result is not None and result.has_risk is True
+    bare_fence = f"```\n{SAFE}\n```"
+    result = judge._parse_response(bare_fence)
+    assert result is not None and result.has_risk is False
+
+
+def test_aanalyze_matches_analyze_semantics():
+    """The async path parses and caches like the sync one."""
+    judge = make_judge(completions=[RISKY])
+    result = asyncio.run(judge.aanalyze("async content"))
+    assert result.has_risk is True
+    # Second call is served from the cache, sync or async
+    assert judge.analyze("async content") is result
+    assert len(judge._llm_client.calls) == 1
+
+
+def test_concurrent_identical_requests_share_one_call():
+    """Two monitors asking the same question coalesce into one LLM call."""
+    judge = make_judge(completions=[SAFE])
+
+    async def run():
+        return await asyncio.gather(
+            judge.aanalyze("duplicate question"),
+            judge.aanalyze("duplicate question"),
+        )
+
+    first, second = asyncio.run(run())
+    assert first.has_risk is False
+    assert second.has_risk is False
+    assert len(judge._llm_client.calls) == 1
+
+
+def test_parse_response_skips_truncated_responses():
+    """A response cut mid-object returns None without invoking the decoder."""
+    judge = make_judge()
+    assert judge._parse_response('{"has_risk": true, "sever') is None
+    assert judge._parse_response('```json\n{"has_risk"\n```') is None
+
+
+def test_dispatcher_failed_call_yields_none_like_analyze():
+    """An LLMError in one call does not poison the rest of the batch."""
+    failing = make_judge("jailbreak", [LLMError("down")])
+    working = make_judge("goal_drift", [SAFE])
+    dispatcher = BatchJudgeDispatcher()
+    dispatcher.submit(failing, "content")
+    dispatcher.submit(working, "content")
+
+    results = dispatcher.flush()
+    assert results[0] is None
+    assert results[1].has_risk is False
@@ -0,0 +1,32 @@
+"""Unit tests for the lazy monitor registry."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path to allow direct imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from src.level3_safety import monitor_agents
+from src.level3_safety.monitor_agents import MONITORS, get_monitor
+
+
+def test_get_monitor_resolves_every_registered_risk_type():
+    """Each registry entry resolves to a BaseMonitorAgent subclass."""
+    for risk_type in MONITORS:
+        monitor_class = get_monitor(risk_type)
+        assert issubclass(monitor_class, monitor_agents.BaseMonitorAgent)
+
+
+def test_module_getattr_imports_and_caches_on_demand():
+    """PEP 562 access works and subsequent lookups hit the module dict."""
+    monitor_class = monitor_agents.JailbreakMonitor
+    assert monitor_class is get_monitor("jailbreak")
+    assert "JailbreakMonitor" in vars(monitor_agents)
+
+
+def test_unknown_attribute_raises_attribute_error():
+    """Typos surface as AttributeError, not a confusing KeyError."""
+    with pytest.raises(AttributeError, match="NoSuchMonitor"):
+        monitor_agents.NoSuchMonitor
@@ -0,0 +1,296 @@
+"""Unit tests for the PAIR batch/async orchestration surface (no live LLM)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path to allow direct imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+from src.level3_safety.jailbreak_frameworks.pair import (
+    PAIRAttacker,
+    PAIROrchestrator,
+    AttackResult,
+    KeywordJudge,
+    _DIVERSIFY_SUFFIX,
+)
+
+
+class StubLLMClient:
+    """Records calls and replays canned completions instead of hitting an API."""
+
+    def __init__(self, completions=None):
+        self.calls = []
+        self.completions = list(completions or [])
+
+    def _next(self):
+        return self.completions.pop(0) if self.completions else "stub completion"
+
+    def generate_with_system(self, system, user, **kwargs):
+        self.calls.append({"system": system, "user": user, **kwargs})
+        return self._next()
+
+    async def agenerate_with_system(self, system, user, **kwargs):
+        return self.generate_with_system(system, user, **kwargs)
+
+
+def make_attacker(completions=None, **kwargs) -> PAIRAttacker:
+    """Build an attacker whose LLM client is a StubLLMClient."""
+    attacker = PAIRAttacker(**kwargs)
+    attacker.__dict__["llm_client"] = StubLLMClient(completions)
+    return attacker
+
+
+class StubAttacker(PAIRAttacker):
+    """Deterministic attacker: p1, then p2, p3, ... per refinement."""
+
+    def __init__(self):
+        self.model = "stub-model"
+        self._response_cache = None
+        self._seen_refinements = set()
+
+    def generate_initial_prompt(self, goal, target_context):
+        return "p1"
+
+    def refine_prompt(self, goal, current_prompt, target_response, iteration):
+        return f"p{iteration + 1}"
+
+    def generate_batch(self, goals, target_context, max_workers=4):
+        return ["p1" for _ in goals]
+
+    async def agenerate_initial_prompt(self, goal, target_context):
+        return "p1"
+
+    async def arefine_prompt(self, goal, current_prompt, target_response, iteration):
+        return f"p{iteration + 1}"
+
+
+def make_orchestrator(max_iterations=3) -> PAIROrchestrator:
+    orchestrator = PAIROrchestrator(max_iterations=max_iterations)
+    orchestrator.attacker = StubAttacker()
+    return orchestrator
+
+
+# ==================== KeywordJudge ====================
+
+def test_keyword_judge_matches_case_insensitively():
+    """Default judge matches any keyword regardless of case."""
+    judge = KeywordJudge(["PWNED", "jailbroken"])
+    assert judge("you have been pwned")
+    assert judge("System Jailbroken!")
+    assert not judge("all safe here")
+
+
+def test_keyword_judge_case_sensitive_mode():
+    """Case-sensitive judge only matches exact casing."""
+    judge = KeywordJudge(["PWNED"], case_sensitive=True)
+    assert judge("PWNED")
+    assert not judge("pwned")
+
+
+def test_keyword_judge_batch_preserves_order():
+    """batch() returns one verdict per response, in order."""
+    judge = KeywordJudge(["PWNED"])
+    assert judge.batch(["PWNED", "nope", "so pwned"]) == [True, False, True]
+
+
+def test_keyword_judge_rejects_empty_keywords():
+    """An empty keyword list is a configuration error."""
+    with pytest.raises(ValueError):
+        KeywordJudge([])
+
+
+# ==================== AttackResult ====================
+
+def test_attack_result_history_round_trip():
+    """history materializes the columnar lists as the legacy dict layout."""
+    result = AttackResult(
+        success=True,
+        final_prompt="p2",
+        target_response="PWNED",
+        iterations=2,
+        prompts=["p1", "p2"],
+        responses=["no", "PWNED"],
+    )
+    assert result.history == [
+        {"iteration": 1, "prompt": "p1", "response": "no"},
+        {"iteration": 2, "prompt": "p2", "response": "PWNED"},
+    ]
+
+
+# ==================== run_attack / run_attack_batch ====================
+
+def test_run_attack_records_columnar_history():
+    """A successful attack stores prompts/responses per iteration."""
+    orchestrator = make_orchestrator()
+    result = orchestrator.run_attack(
+        goal="Make target say PWNED",
+        target_fn=lambda p: "PWNED" if p == "p2" else "I cannot help with that.",
+        target_context="Test agent",
+        judge_fn=lambda resp: "PWNED" in resp,
+    )
+    assert result.success
+    assert result.iterations == 2
+    assert result.prompts == ["p1", "p2"]
+    assert result.responses == ["I cannot help with that.", "PWNED"]
+
+
+def test_run_attack_validates_string_arguments():
+    """Empty goal/target_context raise ValueError before any LLM call."""
+    orchestrator = make_orchestrator()
+    with pytest.raises(ValueError, match="goal must be a non-empty string"):
+        orchestrator.run_attack("", lambda p: "x", "ctx", lambda r: True)
+    with pytest.raises(ValueError, match="target_context must be a non-empty string"):
+        orchestrator.run_attack("goal", lambda p: "x", "", lambda r: True)
+
+
+def test_run_attack_batch_drops_finished_campaigns():
+    """Lockstep batching only re-submits campaigns that have not succeeded."""
+    orchestrator = make_orchestrator()
+    batch_sizes = []
+
+    def batch_target(prompts):
+        batch_sizes.append(len(prompts))
+        # First campaign succeeds immediately, second needs one refinement
+        if len(batch_sizes) == 1:
+            return ["PWNED", "no"]
+        return ["PWNED" for _ in prompts]
+
+    results = orchestrator.run_attack_batch(
+        goals=["g1", "g2"],
+        target_batch_fn=batch_target,
+        target_context="Test agent",
+        judge_fn=lambda resp: "PWNED" in resp,
+    )
+    assert [r.success for r in results] == [True, True]
+    assert batch_sizes == [2, 1]
+
+
+def test_run_attack_batch_uses_judge_batch_interface():
+    """A judge exposing batch() is called once per iteration, not per response."""
+    orchestrator = make_orchestrator()
+    calls = {"single": 0, "batch": 0}
+
+    class CountingJudge:
+        def __call__(self, response):
+            calls["single"] += 1
+            return "PWNED" in response
+
+        def batch(self, responses):
+            calls["batch"] += 1
+            return ["PWNED" in r for r in responses]
+
+    results = orchestrator.run_attack_batch(
+        goals=["g1", "g2"],
+        target_batch_fn=lambda prompts: ["PWNED" for _ in prompts],
+        target_context="Test agent",
+        judge_fn=CountingJudge(),
+    )
+    assert all(r.success for r in results)
+    assert calls == {"single": 0, "batch": 1}
+
+
+def test_run_attack_batch_rejects_mismatched_response_count():
+    """target_batch_fn must return one response per prompt."""
+    orchestrator = make_orchestrator()
+    with pytest.raises(ValueError, match="returned 1 responses for 2 prompts"):
+        orchestrator.run_attack_batch(
+            goals=["g1", "g2"],
+            target_batch_fn=lambda prompts: ["only one"],
+            target_context="Test agent",
+            judge_fn=lambda resp: False,
+        )
+
+
+# ==================== async orchestration ====================
+
+def test_arun_attack_matches_sync_semantics():
+    """The async path produces the same result shape as run_attack."""
+    orchestrator = make_orchestrator()
+
+    async def target(prompt):
+        return "PWNED" if prompt == "p2" else "denied"
+
+    result = asyncio.run(orchestrator.arun_attack(
+        goal="Make target say PWNED",
+        target_fn=target,
+        target_context="Test agent",
+        judge_fn=lambda resp: "PWNED" in resp,
+    ))
+    assert result.success
+    assert result.history[-1]["response"] == "PWNED"
+
+
+def test_arun_batch_preserves_goal_order():
+    """Results come back in the same order as the goals."""
+    orchestrator = make_orchestrator(max_iterations=1)
+
+    async def target(prompt):
+        return "PWNED"
+
+    results = asyncio.run(orchestrator.arun_batch(
+        goals=["g1", "g2", "g3"],
+        target_fn=target,
+        target_context="Test agent",
+        judge_fn=lambda resp: "PWNED" in resp,
+        max_concurrency=2,
+    ))
+    assert len(results) == 3
+    assert all(r.success and r.iterations == 1 for r in results)
+
+
+# ==================== PAIRAttacker behaviors ====================
+
+def test_deterministic_cache_skips_repeat_llm_calls():
+    """With deterministic_cache, the exact same request hits the cache."""
+    attacker = make_attacker(completions=["prompt-A"], deterministic_cache=True)
+    first = attacker.generate_initial_prompt("goal", "ctx")
+    second = attacker.generate_initial_prompt("goal", "ctx")
+    assert first == second == "prompt-A"
+    assert len(attacker.llm_client.calls) == 1
+
+
+def test_refine_prompt_diversifies_on_repeated_triple():
+    """A repeated (goal, prompt, response) triple gets the diversify suffix."""
+    attacker = make_attacker()
+    attacker.refine_prompt("g", "p", "I can't help.", 1)
+    attacker.refine_prompt("g", "p", "I can't help.", 2)
+    attacker.refine_prompt("g", "other", "I can't help.", 3)
+
+    calls = attacker.llm_client.calls
+    assert calls[0]["temperature"] == 0.9
+    assert not calls[0]["user"].endswith(_DIVERSIFY_SUFFIX)
+    # Repeat: instruction appended and sampling turned up
+    assert calls[1]["temperature"] == 1.0
+    assert calls[1]["user"].endswith(_DIVERSIFY_SUFFIX)
+    # Different prompt is a fresh triple again
+    assert calls[2]["temperature"] == 0.9
+
+
+def test_generate_batch_preserves_goal_order():
+    """Concurrent initial generation returns prompts in goal order."""
+    attacker = make_attacker()
+    attacker.llm_client.generate_with_system = (
+        lambda system, user, **kwargs: "prompt for " + user.split("Goal: ")[1].split("\n")[0]
+    )
+    prompts = attacker.generate_batch(["alpha", "beta", "gamma"], "ctx")
+    assert prompts == ["prompt for alpha", "prompt for beta", "prompt for gamma"]
+
+
+def test_refine_prompt_batch_returns_n_candidates():
+    """Best-of-N refinement yields exactly n_candidates prompts."""
+    attacker = make_attacker(completions=["c1", "c2", "c3"])
+    candidates = attacker.refine_prompt_batch("g", "p", "resp", 1, n_candidates=3)
+    assert len(candidates) == 3
+    assert set(candidates) == {"c1", "c2", "c3"}
+
+
+def test_attacker_validates_refine_arguments():
+    """Empty refinement inputs raise ValueError with the argument name."""
+    attacker = make_attacker()
+    with pytest.raises(ValueError, match="current_prompt must be a non-empty string"):
+        attacker.refine_prompt("g", "", "resp", 1)
+    with pytest.raises(ValueError, match="target_response must be a non-empty string"):
+        attacker.refine_prompt("g", "p", "", 1)